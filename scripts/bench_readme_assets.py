@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""Benchmark gen_readme_assets.py phases on synthetic catalogs.
+
+Generates projects.toml catalogs and READMEs of the requested sizes and times
+cold and cached catalog loading, column partitioning, dashboard rendering,
+the README star pass, and the stats/description fetch paths. Network phases run against an
+in-process stand-in for api.github.com and the models endpoint with
+configurable latency, rate limit and error rate. Results are written as JSON;
+`--compare OLD NEW` prints the ratio between two result files.
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import contextlib
+import hashlib
+import io
+import json
+import platform
+import random
+import re
+import socket
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import urllib.parse
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import gen_readme_assets as gen
+
+OWNER = "bench"
+PUSHED_BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _repo_name(i: int) -> str:
+    return f"{OWNER}/project-{i:06d}"
+
+
+def _repo_index(name: str) -> int:
+    m = re.search(r"project-(\d+)$", name)
+    return int(m.group(1)) if m else 0
+
+
+def _repo_stars(i: int) -> int:
+    return int(hashlib.sha256(str(i).encode()).hexdigest()[:6], 16) % 5000
+
+
+def _repo_pushed(i: int) -> datetime:
+    return PUSHED_BASE - timedelta(hours=i)
+
+
+class _FakeApi:
+    """Threaded local server answering the GitHub REST/GraphQL and Models calls the script makes.
+
+    Every response carries X-RateLimit-* headers for a budget of `rate_limit`
+    requests per `window` seconds; past it, requests get 403 until the window
+    resets. `error_rate` of requests get a secondary-rate-limit 403 with
+    Retry-After: 0.
+    """
+
+    def __init__(
+        self, *, latency: float, rate_limit: int, window: float, error_rate: float, listed: int, seed: int
+    ) -> None:
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.window = window
+        self.error_rate = error_rate
+        self.listed = listed
+        self.requests = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._used = 0
+        self._readme = base64.b64encode(b"# Synthetic\n\nA synthetic repository used for benchmarks.\n").decode()
+
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                # Headers and body go out in separate writes; without this,
+                # Nagle plus delayed ACKs adds ~40ms to every response.
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                api._handle(self, None)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                api._handle(self, self.rfile.read(length))
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_port}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _budget(self) -> tuple[bool, dict[str, str], bool]:
+        """Count one request; return (allowed, rate-limit headers, secondary limit hit)."""
+        with self._lock:
+            self.requests += 1
+            now = time.time()
+            if now - self._window_start >= self.window:
+                self._window_start = now
+                self._used = 0
+            self._used += 1
+            remaining = max(0, self.rate_limit - self._used)
+            headers = {
+                "X-RateLimit-Limit": str(self.rate_limit),
+                "X-RateLimit-Remaining": str(remaining),
+                "X-RateLimit-Reset": f"{self._window_start + self.window:.3f}",
+            }
+            secondary = self.error_rate > 0 and self._rng.random() < self.error_rate
+            return self._used <= self.rate_limit, headers, secondary
+
+    def _handle(self, req: BaseHTTPRequestHandler, body: bytes | None) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        allowed, headers, secondary = self._budget()
+        if secondary:
+            headers["Retry-After"] = "0"
+            self._send(req, 403, {"message": "You have exceeded a secondary rate limit."}, headers)
+            return
+        if not allowed:
+            self._send(req, 403, {"message": "API rate limit exceeded."}, headers)
+            return
+
+        url = urllib.parse.urlsplit(req.path)
+        path = url.path
+        if body is not None and path.endswith("/graphql"):
+            payload = self._graphql(json.loads(body))
+        elif body is not None and path.endswith("/chat/completions"):
+            payload = self._chat(json.loads(body))
+        elif re.fullmatch(r"/users/[^/]+/repos", path):
+            page = int(urllib.parse.parse_qs(url.query).get("page", ["1"])[0])
+            start = (page - 1) * 100
+            payload = [self._repo(i) for i in range(start, min(start + 100, self.listed))]
+        elif m := re.fullmatch(r"/repos/([^/]+/[^/]+)(/.*)?", path):
+            payload = self._repo_resource(_repo_index(m.group(1)), m.group(2) or "")
+        else:
+            payload = None
+        if payload is None:
+            self._send(req, 404, {"message": "Not Found"}, headers)
+        else:
+            self._send(req, 200, payload, headers)
+
+    @staticmethod
+    def _send(req: BaseHTTPRequestHandler, status: int, payload: Any, headers: dict[str, str]) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        req.send_response(status)
+        req.send_header("Content-Type", "application/json")
+        req.send_header("Content-Length", str(len(data)))
+        for key, value in headers.items():
+            req.send_header(key, value)
+        req.end_headers()
+        req.wfile.write(data)
+
+    @staticmethod
+    def _repo(i: int) -> dict[str, Any]:
+        return {
+            "full_name": _repo_name(i),
+            "description": f"Synthetic project {i}",
+            "topics": ["bench"],
+            "stargazers_count": _repo_stars(i),
+            "pushed_at": _repo_pushed(i).isoformat().replace("+00:00", "Z"),
+        }
+
+    def _repo_resource(self, i: int, sub: str) -> Any:
+        if sub == "":
+            return self._repo(i)
+        if sub == "/languages":
+            return {"Python": 1000 + i}
+        if sub == "/git/trees/HEAD":
+            return {"tree": [{"path": "README.md", "type": "blob", "sha": f"{i:040x}"}]}
+        if sub.startswith("/git/blobs/") or sub == "/readme":
+            return {"content": self._readme, "sha": f"{i:040x}"}
+        return None
+
+    def _graphql(self, payload: dict[str, Any]) -> dict[str, Any]:
+        data = {}
+        for alias, _, name in re.findall(r'(r\d+): repository\(owner: "([^"]+)", name: "([^"]+)"\)', payload["query"]):
+            i = _repo_index(name)
+            data[alias] = {
+                "stargazerCount": _repo_stars(i),
+                "pushedAt": _repo_pushed(i).isoformat().replace("+00:00", "Z"),
+            }
+        return {"data": data}
+
+    def _chat(self, payload: dict[str, Any]) -> dict[str, Any]:
+        prompt = payload["messages"][0]["content"]
+        if payload.get("response_format", {}).get("type") == "json_object":
+            keys = re.search(r"keys are exactly (.*?) and whose", prompt)
+            repos = json.loads(f"[{keys.group(1)}]") if keys else []
+            content = json.dumps({repo: f"Synthetic summary of {repo}." for repo in repos})
+        else:
+            content = "Synthetic summary of a benchmark repository."
+        return {"choices": [{"message": {"content": content}}]}
+
+
+def _catalog_toml(projects: int, per_category: int) -> str:
+    lines = ["[config]", f'github_owner = "{OWNER}"', ""]
+    for c in range(0, projects, per_category):
+        lines += ["[[categories]]", f'id = "cat{c}"', f'title = "Category {c // per_category}"', ""]
+        for i in range(c, min(c + per_category, projects)):
+            lines += [
+                "  [[categories.projects]]",
+                f'  id = "p{i}"',
+                f'  title = "project-{i:06d}"',
+                f'  repo = "{_repo_name(i)}"',
+                f'  desc = "Synthetic project number {i} for benchmarking the dashboard renderer."',
+                '  tags = ["Python", "Bench"]',
+                "",
+            ]
+    return "\n".join(lines)
+
+
+def _readme_text(projects: int) -> str:
+    out = ["# Bench\n", "## Projects\n"]
+    for i in range(projects):
+        name = _repo_name(i)
+        short = name.split("/")[1]
+        if i % 2:
+            out.append(f"- **[{short}](https://github.com/{name})** ⭐1 - synthetic\n")
+        else:
+            out.append(f'<dt><a href="https://github.com/{name}"><b>{short}</b></a> <sub>⭐1</sub></dt>\n')
+            out.append(f"<dd>Synthetic project {i}</dd>\n")
+    return "".join(out)
+
+
+def _measure(fn: Callable[[], Any], api: _FakeApi | None, trace_memory: bool) -> tuple[Any, dict[str, Any]]:
+    before = api.requests if api else 0
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fn()
+    wall = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    if trace_memory:
+        tracemalloc.stop()
+    requests = (api.requests - before) if api else 0
+    return result, {
+        "wall_s": round(wall, 6),
+        "peak_mem_bytes": peak,
+        "requests": requests,
+        "requests_per_s": round(requests / wall, 1) if requests and wall else 0.0,
+    }
+
+
+def _run_size(projects: int, args: argparse.Namespace, api: _FakeApi, tmp: Path) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+
+    def record(phase: str, fn: Callable[[], Any], net: bool = False, **extra: Any) -> Any:
+        gen._SESSION.cache = None
+        gen._SESSION.limiter = gen._RateLimiter(max_retries=args.retries, max_wait=args.window + 1)
+        value, metrics = _measure(fn, api if net else None, not args.no_memory)
+        results.append({"phase": phase, "projects": projects, **metrics, **extra})
+        print(f"  {phase:<14} {metrics['wall_s']:>10.4f}s", file=sys.stderr)
+        return value
+
+    catalog_path = tmp / f"projects-{projects}.toml"
+    catalog_path.write_text(_catalog_toml(projects, args.per_category), encoding="utf-8")
+    readme_path = tmp / f"README-{projects}.md"
+    readme_path.write_text(_readme_text(projects), encoding="utf-8")
+
+    # The catalog loads the way main() does: a cold compile that writes the
+    # cache, then a warm load of the unchanged file straight from it.
+    cache_path = tmp / f"catalog-compiled-{projects}.json"
+
+    def load_catalog() -> list[gen.Category]:
+        compiled = gen._CompiledCatalog(cache_path)
+        categories, _ = compiled.load(catalog_path)
+        compiled.save()
+        return categories
+
+    cache_path.unlink(missing_ok=True)
+    categories = record("load_catalog", load_catalog)
+    results[-1]["categories"] = len(categories)
+    record("catalog_cached", load_catalog)
+    record("split_columns", lambda: gen._split_into_columns(categories, args.columns))
+
+    repos = [_repo_name(i) for i in range(projects)]
+    stats = {r: gen.RepoStats(stars=_repo_stars(i), pushed_at=_repo_pushed(i)) for i, r in enumerate(repos)}
+
+    def render() -> int:
+        svg = gen._render_project_dashboard_svg(
+            categories=categories,
+            repo_stats=stats,
+            icon_data={},
+            variant="dark",
+            layout="desktop",
+            columns=args.columns,
+        )
+        return len(svg.encode("utf-8"))
+
+    size = record("render", render)
+    results[-1]["output_bytes"] = size
+
+    def stars() -> bool:
+        doc = gen._ReadmeDoc(readme_path)
+        changed = gen._update_readme_stars(doc, stats)
+        doc.render()
+        return changed
+
+    record("readme_stars", stars)
+
+    fetched = repos[: args.max_fetch]
+    record(
+        "fetch_rest",
+        lambda: gen._fetch_all_repo_stats(fetched, "bench", concurrency=args.concurrency),
+        net=True,
+        repos=len(fetched),
+    )
+    record(
+        "fetch_graphql",
+        lambda: gen._fetch_all_repo_stats(fetched, "bench", concurrency=args.concurrency, backend="graphql"),
+        net=True,
+        repos=len(fetched),
+    )
+    api.listed = len(fetched)
+    record("owner_sync", lambda: gen._fetch_owner_repo_stats(OWNER, "bench"), net=True, repos=len(fetched))
+
+    described = repos[: args.max_describe]
+    record(
+        "describe",
+        lambda: gen._describe_repos(
+            described,
+            "bench",
+            context_workers=args.concurrency,
+            llm_workers=args.llm_concurrency,
+            batch_size=args.llm_batch_size,
+        ),
+        net=True,
+        repos=len(described),
+    )
+    return results
+
+
+def _compare(old_path: Path, new_path: Path) -> int:
+    old = json.loads(old_path.read_text(encoding="utf-8"))
+    new = json.loads(new_path.read_text(encoding="utf-8"))
+    before = {(r["phase"], r["projects"]): r for r in old["results"]}
+    print(f"{'phase':<14} {'projects':>9} {'old s':>10} {'new s':>10} {'time':>7} {'mem':>7}")
+    for r in new["results"]:
+        o = before.get((r["phase"], r["projects"]))
+        if not o:
+            continue
+        t = r["wall_s"] / o["wall_s"] if o["wall_s"] else float("nan")
+        m = (
+            f"{r['peak_mem_bytes'] / o['peak_mem_bytes']:.2f}x"
+            if r.get("peak_mem_bytes") and o.get("peak_mem_bytes")
+            else "-"
+        )
+        print(f"{r['phase']:<14} {r['projects']:>9} {o['wall_s']:>10.4f} {r['wall_s']:>10.4f} {t:>6.2f}x {m:>7}")
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark gen_readme_assets.py on synthetic catalogs.")
+    ap.add_argument(
+        "--sizes",
+        default="10,100,1000,10000,100000",
+        help="Comma-separated project counts (default: 10,100,1000,10000,100000).",
+    )
+    ap.add_argument("--per-category", type=int, default=10, help="Projects per category (default: 10).")
+    ap.add_argument("--columns", type=int, default=2, help="Desktop dashboard columns (default: 2).")
+    ap.add_argument("--max-fetch", type=int, default=2000, help="Cap on repos in fetch phases (default: 2000).")
+    ap.add_argument("--max-describe", type=int, default=200, help="Cap on repos in the describe phase (default: 200).")
+    ap.add_argument("--concurrency", type=int, default=8, help="Fetch/context worker threads (default: 8).")
+    ap.add_argument("--llm-concurrency", type=int, default=2, help="Model request threads (default: 2).")
+    ap.add_argument("--llm-batch-size", type=int, default=8, help="Repos per model request (default: 8).")
+    ap.add_argument("--latency", type=float, default=0.005, help="Fake API latency per request in seconds (default: 0.005).")
+    ap.add_argument("--rate-limit", type=int, default=5000, help="Fake API requests per window (default: 5000).")
+    ap.add_argument("--window", type=float, default=2.0, help="Fake API rate-limit window in seconds (default: 2).")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="Fraction of secondary-rate-limit 403s (default: 0).")
+    ap.add_argument("--retries", type=int, default=3, help="Client retries for rate-limited responses (default: 3).")
+    ap.add_argument("--seed", type=int, default=1, help="Seed for the fake API's error injection (default: 1).")
+    ap.add_argument("--no-memory", action="store_true", help="Skip tracemalloc; faster, but no peak memory figures.")
+    ap.add_argument("--out", default="bench-results.json", help="Results JSON path (default: bench-results.json).")
+    ap.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two results files and exit.")
+    args = ap.parse_args(argv)
+
+    if args.compare:
+        return _compare(Path(args.compare[0]), Path(args.compare[1]))
+
+    try:
+        sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    except ValueError:
+        gen._die(f"Invalid --sizes {args.sizes!r}")
+
+    api = _FakeApi(
+        latency=args.latency,
+        rate_limit=args.rate_limit,
+        window=args.window,
+        error_rate=args.error_rate,
+        listed=0,
+        seed=args.seed,
+    )
+    gen.GITHUB_API = api.base_url
+    gen.MODELS_URL = f"{api.base_url}/chat/completions"
+
+    results: list[dict[str, Any]] = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="readme-bench-") as tmp:
+            for projects in sizes:
+                print(f"{projects} projects", file=sys.stderr)
+                results += _run_size(projects, args, api, Path(tmp))
+    finally:
+        api.close()
+        gen._SESSION.close()
+
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "script_sha256": hashlib.sha256(Path(gen.__file__).read_bytes()).hexdigest(),
+        },
+        "config": {k: v for k, v in vars(args).items() if k not in ("out", "compare")},
+        "results": results,
+    }
+    gen._atomic_write_text(Path(args.out), json.dumps(report, indent=2))
+    print(f"Results: {args.out}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
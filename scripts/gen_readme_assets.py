@@ -3,15 +3,28 @@ from __future__ import annotations
 
 import argparse
 import base64
+import contextlib
+import gzip
+import hashlib
+import heapq
+import http.client
 import json
 import os
+import random
+import re
+import struct
 import sys
+import threading
 import time
 import tomllib
 import urllib.error
-import urllib.request
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import urllib.parse
+import zlib
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from email.message import Message
 from pathlib import Path
 from typing import Any
 
@@ -95,6 +108,15 @@ def _esc(s: str) -> str:
     )
 
 
+def _atomic_write_text(path: Path, content: str) -> None:
+    # Write to a sibling temp file and rename, so an interrupted run never
+    # leaves a truncated file behind.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(content, encoding="utf-8")
+    os.replace(tmp, path)
+
+
 def _read_toml(path: Path) -> dict[str, Any]:
     with path.open("rb") as f:
         data = tomllib.load(f)
@@ -103,80 +125,803 @@ def _read_toml(path: Path) -> dict[str, Any]:
     return data
 
 
+def _github_owner(config: dict[str, Any]) -> str | None:
+    owner = str(config.get("github_owner") or "").strip()
+    return owner or None
+
+
 def _load_catalog(path: Path) -> list[Category]:
     data = _read_toml(path)
+    return [_compile_category(c, path) for c in _catalog_categories(data, path)]
+
+
+def _catalog_categories(data: dict[str, Any], path: Path) -> list[Any]:
     categories_raw = data.get("categories")
     if not isinstance(categories_raw, list) or not categories_raw:
         _die(f"Expected [[categories]] in {path}")
+    return categories_raw
+
+
+def _compile_category(c: Any, path: Path) -> Category:
+    """Validate one raw [[categories]] table into a Category."""
+    if not isinstance(c, dict):
+        _die(f"Invalid category entry in {path}: {c!r}")
+
+    cid = str(c.get("id", "")).strip()
+    title = str(c.get("title", "")).strip()
+    icon = c.get("icon")
+    icon_s = str(icon).strip() if icon else None
+
+    if not cid or not title:
+        _die(f"Category missing id/title in {path}: {c!r}")
+    _require_ascii(f"category.id {cid}", cid)
+    _require_ascii(f"category.title {cid}", title)
+
+    projects_raw = c.get("projects", [])
+    if not isinstance(projects_raw, list):
+        _die(f"Invalid projects list for category {cid} in {path}")
+
+    projects: list[Project] = []
+    for p in projects_raw:
+        if not isinstance(p, dict):
+            _die(f"Invalid project entry in category {cid}: {p!r}")
+
+        pid = str(p.get("id", "")).strip()
+        ptitle = str(p.get("title", "")).strip()
+        desc = str(p.get("desc", "")).strip()
+
+        repo = p.get("repo")
+        repo_s = str(repo).strip() if repo else None
+
+        demo = p.get("demo")
+        demo_s = str(demo).strip() if demo else None
+
+        private = bool(p.get("private", False))
+
+        tags_raw = p.get("tags", [])
+        if not isinstance(tags_raw, list):
+            _die(f"Invalid tags for project {pid} in category {cid}")
+        tags = [str(t).strip() for t in tags_raw if str(t).strip()]
+
+        if not pid or not ptitle or not desc:
+            _die(f"Project missing required fields in category {cid}: {p!r}")
+
+        _require_ascii(f"project.id {pid}", pid)
+        _require_ascii(f"project.title {pid}", ptitle)
+        _require_ascii(f"project.desc {pid}", desc)
+        for t in tags:
+            _require_ascii(f"project.tag {pid}", t)
+
+        projects.append(
+            Project(
+                id=pid,
+                title=ptitle,
+                desc=desc,
+                tags=tags,
+                repo=repo_s,
+                demo=demo_s,
+                private=private,
+            )
+        )
 
-    categories: list[Category] = []
-    for c in categories_raw:
-        if not isinstance(c, dict):
-            _die(f"Invalid category entry in {path}: {c!r}")
-
-        cid = str(c.get("id", "")).strip()
-        title = str(c.get("title", "")).strip()
-        icon = c.get("icon")
-        icon_s = str(icon).strip() if icon else None
-
-        if not cid or not title:
-            _die(f"Category missing id/title in {path}: {c!r}")
-        _require_ascii(f"category.id {cid}", cid)
-        _require_ascii(f"category.title {cid}", title)
-
-        projects_raw = c.get("projects", [])
-        if not isinstance(projects_raw, list):
-            _die(f"Invalid projects list for category {cid} in {path}")
-
-        projects: list[Project] = []
-        for p in projects_raw:
-            if not isinstance(p, dict):
-                _die(f"Invalid project entry in category {cid}: {p!r}")
-
-            pid = str(p.get("id", "")).strip()
-            ptitle = str(p.get("title", "")).strip()
-            desc = str(p.get("desc", "")).strip()
-
-            repo = p.get("repo")
-            repo_s = str(repo).strip() if repo else None
-
-            demo = p.get("demo")
-            demo_s = str(demo).strip() if demo else None
-
-            private = bool(p.get("private", False))
-
-            tags_raw = p.get("tags", [])
-            if not isinstance(tags_raw, list):
-                _die(f"Invalid tags for project {pid} in category {cid}")
-            tags = [str(t).strip() for t in tags_raw if str(t).strip()]
-
-            if not pid or not ptitle or not desc:
-                _die(f"Project missing required fields in category {cid}: {p!r}")
-
-            _require_ascii(f"project.id {pid}", pid)
-            _require_ascii(f"project.title {pid}", ptitle)
-            _require_ascii(f"project.desc {pid}", desc)
-            for t in tags:
-                _require_ascii(f"project.tag {pid}", t)
-
-            projects.append(
-                Project(
-                    id=pid,
-                    title=ptitle,
-                    desc=desc,
-                    tags=tags,
-                    repo=repo_s,
-                    demo=demo_s,
-                    private=private,
-                )
+    return Category(id=cid, title=title, icon=icon_s, projects=projects)
+
+
+# Bump when _compile_category's rules change, so cached entries are re-validated.
+CATALOG_CACHE_VERSION = 1
+_PROJECT_FIELDS = set(Project.__dataclass_fields__)
+
+
+class _CompiledCatalog:
+    """Validated catalog, cached as JSON and keyed by the source file's hash.
+
+    An unchanged projects.toml loads straight from the cache without TOML
+    parsing or validation. When it changed, it is parsed once and only
+    categories whose raw table differs from the cached one are validated
+    again. A cache file of the wrong shape is ignored and rebuilt. With no
+    `path`, nothing is read from or written to disk.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.reused = 0
+        self.compiled = 0
+        self._data: dict[str, Any] = {}
+        self._dirty = False
+        if path and path.exists():
+            try:
+                loaded = json.loads(path.read_text(encoding="utf-8"))
+                if (
+                    isinstance(loaded, dict)
+                    and loaded.get("version") == CATALOG_CACHE_VERSION
+                    and self._valid(loaded)
+                ):
+                    self._data = loaded
+            except Exception:
+                pass
+
+    @staticmethod
+    def _valid(data: dict[str, Any]) -> bool:
+        """Whether `data` has the shape `load` writes, down to field types."""
+
+        def opt_str(v: Any) -> bool:
+            return v is None or isinstance(v, str)
+
+        def project_ok(p: Any) -> bool:
+            return (
+                isinstance(p, dict)
+                and p.keys() == _PROJECT_FIELDS
+                and isinstance(p["id"], str)
+                and isinstance(p["title"], str)
+                and isinstance(p["desc"], str)
+                and isinstance(p["tags"], list)
+                and all(isinstance(t, str) for t in p["tags"])
+                and opt_str(p["repo"])
+                and opt_str(p["demo"])
+                and isinstance(p["private"], bool)
+            )
+
+        def entry_ok(e: Any) -> bool:
+            c = e.get("category") if isinstance(e, dict) else None
+            return (
+                isinstance(c, dict)
+                and isinstance(e.get("raw"), str)
+                and isinstance(c.get("id"), str)
+                and isinstance(c.get("title"), str)
+                and opt_str(c.get("icon"))
+                and isinstance(c.get("projects"), list)
+                and all(project_ok(p) for p in c["projects"])
+            )
+
+        entries = data.get("categories")
+        return (
+            isinstance(data.get("source"), str)
+            and isinstance(data.get("config"), dict)
+            and isinstance(entries, list)
+            and all(entry_ok(e) for e in entries)
+        )
+
+    def load(self, source: Path) -> tuple[list[Category], dict[str, Any]]:
+        """Return (categories, [config] table) for `source`."""
+        raw = source.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if self._data.get("source") == digest:
+            self.reused = len(self._data["categories"])
+            return [self._category(e["category"]) for e in self._data["categories"]], self._data["config"]
+
+        data = tomllib.loads(raw.decode("utf-8"))
+        config = data.get("config")
+        config = config if isinstance(config, dict) else {}
+        known = {e["raw"]: e["category"] for e in self._data.get("categories", [])}
+
+        entries = []
+        categories = []
+        for c in _catalog_categories(data, source):
+            key = _fingerprint(c)
+            if key in known:
+                compiled = known[key]
+                categories.append(self._category(compiled))
+                self.reused += 1
+            else:
+                category = _compile_category(c, source)
+                compiled = self._category_json(category)
+                categories.append(category)
+                self.compiled += 1
+            entries.append({"raw": key, "category": compiled})
+
+        self._data = {
+            "version": CATALOG_CACHE_VERSION,
+            "source": digest,
+            "config": json.loads(json.dumps(config, default=str)),
+            "categories": entries,
+        }
+        self._dirty = True
+        return categories, self._data["config"]
+
+    @staticmethod
+    def _category_json(c: Category) -> dict[str, Any]:
+        # dataclasses.asdict deep-copies every field; this is a fraction of its cost.
+        return {"id": c.id, "title": c.title, "icon": c.icon, "projects": [vars(p) for p in c.projects]}
+
+    @staticmethod
+    def _category(d: dict[str, Any]) -> Category:
+        return Category(
+            id=d["id"],
+            title=d["title"],
+            icon=d["icon"],
+            projects=[Project(**p) for p in d["projects"]],
+        )
+
+    def save(self) -> None:
+        if not self._dirty or not self.path:
+            return
+        _atomic_write_text(self.path, json.dumps(self._data, separators=(",", ":")))
+        self._dirty = False
+
+
+class _Tracer:
+    """In-process timing spans and counters for one run.
+
+    `phase` marks the start of the next top-level step of main() (ending the
+    previous one); `span` times a nested block; HTTP requests are added by
+    the session. `summary` renders a table for the log and `export` writes
+    Chrome trace-event JSON (chrome://tracing, Perfetto).
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[dict[str, Any]] = []
+        self.counters: dict[str, int] = {}
+        self._origin = time.perf_counter()
+        self._phase: tuple[str, float] | None = None
+        self._lock = threading.Lock()
+
+    def add(self, name: str, cat: str, start: float, end: float, **args: Any) -> None:
+        with self._lock:
+            self.spans.append(
+                {"name": name, "cat": cat, "start": start, "end": end, "tid": threading.get_ident(), "args": args}
+            )
+
+    def count(self, name: str, n: int = 1) -> None:
+        if n:
+            with self._lock:
+                self.counters[name] = self.counters.get(name, 0) + n
+
+    def phase(self, name: str | None) -> None:
+        now = time.perf_counter()
+        if self._phase:
+            self.add(self._phase[0], "phase", self._phase[1], now)
+        self._phase = (name, now) if name else None
+
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str = "span", **args: Any) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, cat, start, time.perf_counter(), **args)
+
+    def summary(self) -> str:
+        lines = ["Timing:"]
+        phases = [s for s in self.spans if s["cat"] == "phase"]
+        for s in phases:
+            lines.append(f"  {s['name']:<22} {s['end'] - s['start']:>9.3f}s")
+        if phases:
+            lines.append(f"  {'total':<22} {phases[-1]['end'] - phases[0]['start']:>9.3f}s")
+
+        by_host: dict[str, list[dict[str, Any]]] = {}
+        for s in self.spans:
+            if s["cat"] == "http":
+                by_host.setdefault(s["args"]["host"], []).append(s)
+        if by_host:
+            lines.append(
+                f"  {'host':<34} {'reqs':>5} {'errs':>5} {'cached':>6} {'KiB':>8} {'p50 ms':>7} {'p95 ms':>7} {'max ms':>7}"
+            )
+        for host, spans in sorted(by_host.items()):
+            lat = sorted((s["end"] - s["start"]) * 1000 for s in spans)
+            errors = sum(1 for s in spans if s["args"]["status"] >= 400 or s["args"]["status"] == 0)
+            cached = sum(1 for s in spans if s["args"]["cache"] != "miss")
+            kib = sum(s["args"]["bytes"] for s in spans) / 1024
+            p50 = lat[len(lat) // 2]
+            p95 = lat[min(len(lat) - 1, int(len(lat) * 0.95))]
+            lines.append(
+                f"  {host:<34} {len(spans):>5} {errors:>5} {cached:>6} {kib:>8.1f} {p50:>7.1f} {p95:>7.1f} {lat[-1]:>7.1f}"
+            )
+        if self.counters:
+            lines.append("  " + ", ".join(f"{k}={v}" for k, v in sorted(self.counters.items())))
+        return "\n".join(lines)
+
+    def export(self, path: Path) -> None:
+        tids: dict[int, int] = {}
+        events: list[dict[str, Any]] = []
+        for s in sorted(self.spans, key=lambda s: s["start"]):
+            tid = tids.setdefault(s["tid"], len(tids) + 1)
+            events.append(
+                {
+                    "name": s["name"],
+                    "cat": s["cat"],
+                    "ph": "X",
+                    "ts": round((s["start"] - self._origin) * 1e6, 1),
+                    "dur": round((s["end"] - s["start"]) * 1e6, 1),
+                    "pid": 1,
+                    "tid": tid,
+                    "args": s["args"],
+                }
+            )
+        end = max((s["end"] for s in self.spans), default=self._origin)
+        for name, value in sorted(self.counters.items()):
+            events.append(
+                {"name": name, "ph": "C", "ts": round((end - self._origin) * 1e6, 1), "pid": 1, "args": {name: value}}
+            )
+        _atomic_write_text(path, json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+
+
+_TRACE = _Tracer()
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    status: int
+    headers: Message
+    body: bytes
+    cache: str = "miss"  # "hit" when served from _HttpCache after a 304, "replay" from a cassette.
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8"))
+
+
+class _HttpCache:
+    """On-disk ETag/Last-Modified cache for GET responses, keyed by URL.
+
+    Cached entries are revalidated with If-None-Match/If-Modified-Since.
+    GitHub does not count 304 Not Modified against the rate limit, so an
+    unchanged resource costs a round trip but no budget. Git blobs are
+    addressed by content hash and never change, so they are not cached.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, str]] = {}
+        self._used: set[str] = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+        if path.exists():
+            try:
+                loaded = json.loads(path.read_text(encoding="utf-8"))
+                if isinstance(loaded, dict):
+                    self._entries = loaded
+            except Exception:
+                pass
+
+    @staticmethod
+    def _cacheable(url: str) -> bool:
+        return "/git/blobs/" not in url
+
+    def validators(self, url: str) -> dict[str, str]:
+        if not self._cacheable(url):
+            return {}
+        with self._lock:
+            self._used.add(url)
+        entry = self._entries.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def hit(self, url: str) -> bytes | None:
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        with self._lock:
+            self.hits += 1
+        return entry["body"].encode("utf-8")
+
+    def store(self, url: str, headers: Message, body: bytes) -> None:
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            self.misses += 1
+            if not etag and not last_modified or not self._cacheable(url):
+                return
+            try:
+                text = body.decode("utf-8")
+            except UnicodeDecodeError:
+                return
+            entry = {"etag": etag or "", "last_modified": last_modified or "", "body": text}
+            if self._entries.get(url) != entry:
+                self._entries[url] = entry
+                self._dirty = True
+
+    def save(self, prune: bool = True) -> None:
+        # Drop responses this run no longer asked for; a run that made no
+        # requests at all (e.g. --no-fetch) leaves the cache as it was.
+        if prune and self._used and set(self._entries) - self._used:
+            self._entries = {k: v for k, v in self._entries.items() if k in self._used}
+            self._dirty = True
+        if not self._dirty:
+            return
+        _atomic_write_text(self.path, json.dumps(self._entries, indent=2, sort_keys=True))
+        self._dirty = False
+
+
+class _Cassette:
+    """Recorded HTTP responses keyed by method, URL and a hash of the request body.
+
+    In record mode every response the session returns (or error status it
+    raises) is captured; in replay mode requests are answered from the
+    recording alone and anything not in it fails like a network error.
+    Auth headers are not part of the key, so any token replays a recording.
+    Stored as one JSON file, `cassette.json`, in the given directory.
+    """
+
+    kept_headers = ("Content-Type", "ETag", "Last-Modified", "Link", "Retry-After")
+
+    def __init__(self, directory: Path, *, replay: bool) -> None:
+        self.path = directory / "cassette.json"
+        self.replaying = replay
+        self.recorded = 0
+        self.replayed = 0
+        self.missing = 0
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if replay:
+            try:
+                loaded = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                _die(f"Cannot read cassette {self.path}: {exc}")
+            self._entries = loaded if isinstance(loaded, dict) else {}
+
+    @staticmethod
+    def key(method: str, url: str, body: bytes | None) -> str:
+        body_hash = hashlib.sha256(body or b"").hexdigest()
+        return hashlib.sha256(f"{method} {url} {body_hash}".encode("utf-8")).hexdigest()
+
+    def record(self, method: str, url: str, body: bytes | None, status: int, headers: Message, data: bytes) -> None:
+        entry: dict[str, Any] = {
+            "method": method,
+            "url": url,
+            "status": status,
+            "headers": {
+                k: v for k, v in headers.items()
+                if k in self.kept_headers or k.lower().startswith("x-ratelimit-")
+            },
+        }
+        try:
+            entry["body"] = data.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["body_b64"] = base64.b64encode(data).decode("ascii")
+        with self._lock:
+            self._entries[self.key(method, url, body)] = entry
+            self.recorded += 1
+
+    def play(self, method: str, url: str, body: bytes | None) -> HttpResponse:
+        entry = self._entries.get(self.key(method, url, body))
+        with self._lock:
+            if entry is None:
+                self.missing += 1
+            else:
+                self.replayed += 1
+        if entry is None:
+            raise urllib.error.URLError(f"{method} {url} is not in cassette {self.path}")
+
+        headers = Message()
+        for k, v in entry.get("headers", {}).items():
+            headers[k] = v
+        if "body_b64" in entry:
+            data = base64.b64decode(entry["body_b64"])
+        else:
+            data = str(entry.get("body", "")).encode("utf-8")
+        status = int(entry["status"])
+        if status >= 400:
+            raise urllib.error.HTTPError(url, status, "Replayed error", headers, None)
+        return HttpResponse(status=status, headers=headers, body=data, cache="replay")
+
+    def save(self) -> None:
+        if self.replaying:
+            return
+        _atomic_write_text(self.path, json.dumps(self._entries, indent=1, sort_keys=True))
+
+
+class _RateLimiter:
+    """Paces requests per rate-limit bucket from the server's headers.
+
+    A bucket is a host plus the X-RateLimit-Resource it reports (GitHub's
+    REST "core", "search" and "graphql" budgets are separate); hosts that
+    don't report one share a single bucket. Which resource a request draws
+    on is learned per top-level path segment from earlier responses.
+
+    Requests go out at full speed while X-RateLimit-Remaining is healthy.
+    Below `slow_fraction` of the limit, the remaining budget is spread evenly
+    over the time left until X-RateLimit-Reset. A Retry-After (or an
+    exhausted budget) blocks the host until then. Waits longer than
+    `max_wait` are not taken: the request goes out and fails instead, so a
+    long reset doesn't stall the run.
+    """
+
+    slow_fraction = 0.1
+    backoff_base = 1.0
+
+    def __init__(self, max_retries: int = 3, max_wait: float = 60.0) -> None:
+        self.max_retries = max_retries
+        self.max_wait = max_wait
+        self.waited = 0.0
+        self.retries = 0
+        # (host, resource) -> {"limit", "remaining", "reset", "blocked_until"}
+        self._buckets: dict[tuple[str, str], dict[str, float]] = {}
+        # (host, top-level path segment) -> resource seen in its responses
+        self._resources: dict[tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _route(host: str, path: str) -> tuple[str, str]:
+        return host, path.split("?", 1)[0].lstrip("/").split("/", 1)[0]
+
+    def _bucket(self, host: str, path: str, headers: Message | None = None) -> tuple[str, str]:
+        """Bucket for a request; records the resource when the response names one. Needs the lock."""
+        route = self._route(host, path)
+        resource = headers.get("X-RateLimit-Resource") if headers is not None else None
+        if resource:
+            self._resources[route] = resource
+        return host, resource or self._resources.get(route, "")
+
+    def before(self, host: str, path: str) -> None:
+        """Sleep as needed before sending a request for `path` to `host`."""
+        with self._lock:
+            state = self._buckets.get(self._bucket(host, path))
+            if state is None:
+                return
+            now = time.time()
+            delay = max(0.0, state.get("blocked_until", 0.0) - now)
+            remaining = state.get("remaining")
+            reset = state.get("reset")
+            limit = state.get("limit") or 0
+            if remaining is not None and reset is not None and reset > now:
+                if remaining <= 0:
+                    delay = max(delay, reset - now)
+                elif remaining < limit * self.slow_fraction:
+                    delay = max(delay, (reset - now) / remaining)
+                # Count this request now so concurrent callers see it.
+                state["remaining"] = remaining - 1
+        if 0 < delay <= self.max_wait:
+            with self._lock:
+                self.waited += delay
+            time.sleep(delay)
+
+    def update(self, host: str, path: str, headers: Message) -> None:
+        """Record the budget reported by a response for `path` from `host`."""
+        values = {}
+        for key in ("limit", "remaining", "reset"):
+            raw = headers.get(f"X-RateLimit-{key.capitalize()}")
+            if raw is not None:
+                try:
+                    values[key] = float(raw)
+                except ValueError:
+                    pass
+        if not values:
+            return
+        with self._lock:
+            state = self._buckets.setdefault(self._bucket(host, path, headers), {})
+            same_window = values.get("reset") == state.get("reset")
+            if same_window and "remaining" in values and "remaining" in state:
+                # Responses to concurrent requests can arrive out of order.
+                values["remaining"] = min(values["remaining"], state["remaining"])
+            state.update(values)
+
+    def retry_delay(
+        self, host: str, path: str, status: int, headers: Message, body: bytes, attempt: int
+    ) -> float | None:
+        """Seconds to wait before retrying a 403/429, or None if it should not be retried."""
+        if attempt >= self.max_retries:
+            return None
+        retry_after = headers.get("Retry-After")
+        remaining = headers.get("X-RateLimit-Remaining")
+        limited = (
+            status == 429
+            or retry_after is not None
+            or remaining == "0"
+            or b"rate limit" in body.lower()
+        )
+        if not limited:
+            return None  # A plain 403 (permissions, blocked repo) won't change.
+
+        delay = None
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+        if delay is None and remaining == "0" and headers.get("X-RateLimit-Reset"):
+            try:
+                delay = float(headers["X-RateLimit-Reset"]) - time.time() + 1
+            except ValueError:
+                pass
+        if delay is None:
+            # Full jitter: uniform over [0, base * 2^attempt].
+            delay = random.uniform(0, self.backoff_base * 2**attempt)
+        if delay > self.max_wait:
+            return None
+
+        delay = max(0.0, delay)
+        with self._lock:
+            state = self._buckets.setdefault(self._bucket(host, path, headers), {})
+            state["blocked_until"] = max(state.get("blocked_until", 0.0), time.time() + delay)
+            self.retries += 1
+        return delay
+
+
+class _HttpSession:
+    """Keep-alive HTTP(S) connections pooled per host.
+
+    urllib opens a fresh connection (and TLS handshake) for every call; here
+    idle connections are parked per (scheme, host) and reused by whichever
+    worker thread asks next. Responses are requested gzip-encoded. Errors
+    surface as urllib.error.HTTPError so callers keep their existing handling.
+    When `cache` is set, GET requests are made conditional against it, and
+    when `limiter` is set, requests are paced and rate-limited responses
+    retried through it. A `cassette` records final responses, or in replay
+    mode answers every request without touching the network.
+    """
+
+    max_redirects = 5
+
+    def __init__(self, timeout: float = 30.0, max_idle_per_host: int = 8) -> None:
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.cache: _HttpCache | None = None
+        self.limiter: _RateLimiter | None = _RateLimiter()
+        self.cassette: _Cassette | None = None
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _checkout(self, scheme: str, host: str, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get((scheme, host))
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        return self._connect(scheme, host, timeout), False
+
+    @staticmethod
+    def _connect(scheme: str, host: str, timeout: float) -> http.client.HTTPConnection:
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, timeout=timeout)
+        return http.client.HTTPConnection(host, timeout=timeout)
+
+    def _checkin(self, scheme: str, host: str, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((scheme, host), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+        timeout: float | None = None,
+    ) -> HttpResponse:
+        cassette = self.cassette
+        parts = urllib.parse.urlsplit(url)
+        start = time.perf_counter()
+        status, size, cache = 0, 0, "miss"
+        try:
+            if cassette and cassette.replaying:
+                resp = cassette.play(method, url, body)
+            else:
+                resp = self._send(method, url, headers=headers, body=body, timeout=timeout)
+                if cassette:
+                    cassette.record(method, url, body, resp.status, resp.headers, resp.body)
+            status, size, cache = resp.status, len(resp.body), resp.cache
+            return resp
+        except urllib.error.HTTPError as exc:
+            status = exc.code
+            if cassette and not cassette.replaying:
+                cassette.record(method, url, body, exc.code, exc.headers, b"")
+            raise
+        finally:
+            _TRACE.add(
+                f"{method} {parts.path}",
+                "http",
+                start,
+                time.perf_counter(),
+                host=parts.netloc,
+                status=status,
+                bytes=size,
+                cache=cache,
             )
 
-        categories.append(Category(id=cid, title=title, icon=icon_s, projects=projects))
+    def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None,
+        body: bytes | None,
+        timeout: float | None,
+    ) -> HttpResponse:
+        timeout = self.timeout if timeout is None else timeout
+        cache = self.cache if method == "GET" else None
+
+        redirects = 0
+        attempt = 0
+        while redirects <= self.max_redirects:
+            parts = urllib.parse.urlsplit(url)
+            scheme, host = parts.scheme, parts.netloc
+            path = parts.path or "/"
+            if parts.query:
+                path = f"{path}?{parts.query}"
+
+            hdrs = {"Accept-Encoding": "gzip", **(headers or {})}
+            if cache:
+                hdrs.update(cache.validators(url))
+
+            if self.limiter:
+                self.limiter.before(host, path)
+            conn, reused = self._checkout(scheme, host, timeout)
+            try:
+                conn.request(method, path, body=body, headers=hdrs)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection; retry once fresh.
+                conn = self._connect(scheme, host, timeout)
+                try:
+                    conn.request(method, path, body=body, headers=hdrs)
+                    resp = conn.getresponse()
+                    raw = resp.read()
+                except Exception:
+                    conn.close()
+                    raise
+            except Exception:
+                conn.close()
+                raise
+
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(scheme, host, conn)
+
+            if resp.getheader("Content-Encoding", "").lower() == "gzip":
+                raw = gzip.decompress(raw)
+            if self.limiter:
+                self.limiter.update(host, path, resp.msg)
+
+            location = resp.getheader("Location")
+            if resp.status in (301, 302, 303, 307, 308) and location and method in ("GET", "HEAD"):
+                url = urllib.parse.urljoin(url, location)
+                redirects += 1
+                continue
+
+            if resp.status in (403, 429) and self.limiter:
+                delay = self.limiter.retry_delay(host, path, resp.status, resp.msg, raw, attempt)
+                if delay is not None:
+                    attempt += 1
+                    _TRACE.count("http.retries")
+                    time.sleep(delay)
+                    continue
+
+            if resp.status == 304 and cache:
+                cached = cache.hit(url)
+                if cached is not None:
+                    return HttpResponse(status=200, headers=resp.msg, body=cached, cache="hit")
+
+            if resp.status >= 400:
+                raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.msg, None)
+            if cache and resp.status == 200:
+                cache.store(url, resp.msg, raw)
+            return HttpResponse(status=resp.status, headers=resp.msg, body=raw)
+
+        raise urllib.error.URLError(f"too many redirects: {url}")
+
+
+_SESSION = _HttpSession()
 
-    return categories
+GITHUB_API = "https://api.github.com"
 
 
-def _http_json(url: str, token: str | None) -> dict[str, Any]:
+def _http_json(url: str, token: str | None, body: dict[str, Any] | None = None) -> dict[str, Any]:
     headers = {
         "Accept": "application/vnd.github+json",
         "User-Agent": "johnzfitch-readme-dashboard",
@@ -184,20 +929,27 @@ def _http_json(url: str, token: str | None) -> dict[str, Any]:
     if token:
         headers["Authorization"] = f"Bearer {token}"
 
-    req = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        raw = resp.read().decode("utf-8")
-    payload = json.loads(raw)
+    data = None
+    if body is not None:
+        data = json.dumps(body).encode("utf-8")
+        headers["Content-Type"] = "application/json"
+
+    resp = _SESSION.request("POST" if data else "GET", url, headers=headers, body=data)
+    payload = resp.json()
     if not isinstance(payload, dict):
         raise ValueError(f"Unexpected JSON type from {url}")
     return payload
 
 
+def _parse_github_datetime(raw: str) -> datetime:
+    return datetime.fromisoformat(raw.replace("Z", "+00:00")).astimezone(timezone.utc)
+
+
 def _fetch_repo_stats(repo: str, token: str | None) -> RepoStats | None:
     if "/" not in repo:
         return None
 
-    url = f"https://api.github.com/repos/{repo}"
+    url = f"{GITHUB_API}/repos/{repo}"
     try:
         payload = _http_json(url, token)
     except urllib.error.HTTPError as exc:
@@ -213,10 +965,240 @@ def _fetch_repo_stats(repo: str, token: str | None) -> RepoStats | None:
     if not pushed_at_raw:
         return None
 
-    pushed_at = datetime.fromisoformat(pushed_at_raw.replace("Z", "+00:00")).astimezone(
-        timezone.utc
-    )
-    return RepoStats(stars=stars, pushed_at=pushed_at)
+    return RepoStats(stars=stars, pushed_at=_parse_github_datetime(pushed_at_raw))
+
+
+# GitHub caps GraphQL queries at 500k nodes; 100 aliased repositories is far below.
+GRAPHQL_BATCH_SIZE = 100
+
+
+def _fetch_repo_stats_graphql(repos: list[str], token: str) -> dict[str, RepoStats]:
+    """Fetch stats for up to GRAPHQL_BATCH_SIZE repos in one GraphQL request.
+
+    Each repo is an aliased `repository(...)` sub-query. Repos that fail to
+    resolve are left out of the result so the caller can retry them over REST.
+    """
+    aliases: dict[str, str] = {}
+    fields: list[str] = []
+    for i, repo in enumerate(repos):
+        owner, _, name = repo.partition("/")
+        if not owner or not name:
+            continue
+        alias = f"r{i}"
+        aliases[alias] = repo
+        fields.append(
+            f"{alias}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+            "{ stargazerCount pushedAt }"
+        )
+    if not fields:
+        return {}
+
+    query = "query {\n  " + "\n  ".join(fields) + "\n}"
+    try:
+        payload = _http_json(f"{GITHUB_API}/graphql", token, body={"query": query})
+    except Exception:
+        return {}
+
+    data = payload.get("data")
+    if not isinstance(data, dict):
+        return {}
+
+    out: dict[str, RepoStats] = {}
+    for alias, repo in aliases.items():
+        node = data.get(alias)
+        if not isinstance(node, dict) or not node.get("pushedAt"):
+            continue
+        out[repo] = RepoStats(
+            stars=int(node.get("stargazerCount") or 0),
+            pushed_at=_parse_github_datetime(str(node["pushedAt"])),
+        )
+    return out
+
+
+OWNER_REPOS_PAGE_SIZE = 100
+
+
+def _fetch_owner_repo_stats(owner: str, token: str | None) -> dict[str, RepoStats] | None:
+    """Page through all of the owner's repos, most recently pushed first.
+
+    Every listed repo carries its current star count, so the full listing
+    replaces per-repo calls for everything the owner owns. Returns stats
+    keyed by full name, or None if a page fails (a partial listing can't
+    vouch for what it didn't reach).
+    """
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "johnzfitch-readme-dashboard",
+    }
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+
+    out: dict[str, RepoStats] = {}
+    page = 1
+    while True:
+        url = (
+            f"{GITHUB_API}/users/{urllib.parse.quote(owner)}/repos"
+            f"?sort=pushed&direction=desc&per_page={OWNER_REPOS_PAGE_SIZE}&page={page}"
+        )
+        try:
+            items = _SESSION.request("GET", url, headers=headers).json()
+        except Exception:
+            return None
+        if not isinstance(items, list):
+            return None
+
+        for item in items:
+            if not isinstance(item, dict) or not item.get("full_name") or not item.get("pushed_at"):
+                continue
+            pushed_at = _parse_github_datetime(str(item["pushed_at"]))
+            out[str(item["full_name"])] = RepoStats(
+                stars=int(item.get("stargazers_count") or 0), pushed_at=pushed_at
+            )
+        if len(items) < OWNER_REPOS_PAGE_SIZE:
+            return out
+        page += 1
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: `rate` tokens/sec, bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _fetch_all_repo_stats(
+    repos: list[str],
+    token: str | None,
+    *,
+    concurrency: int = 1,
+    rate: float | None = None,
+    backend: str = "rest",
+) -> dict[str, RepoStats]:
+    """Fetch stats for many repos on a bounded worker pool.
+
+    Pacing comes from the session's rate limiter, which follows the API's own
+    budget headers; `rate` additionally caps requests per second through a
+    shared token bucket.
+    The graphql backend resolves repos in chunks of GRAPHQL_BATCH_SIZE and
+    falls back to REST for any repo a chunk did not return. Result order
+    follows `repos`.
+    """
+    if backend not in ("rest", "graphql"):
+        _die(f"Invalid stats backend: {backend}")
+    if backend == "graphql" and not token:
+        print("Warning: --stats-backend=graphql requires GITHUB_TOKEN; using rest")
+        backend = "rest"
+
+    bucket = _TokenBucket(rate, capacity=10 if token else 1) if rate else None
+
+    def fetch(repo: str) -> RepoStats | None:
+        if bucket:
+            bucket.acquire()
+        return _fetch_repo_stats(repo, token)
+
+    def fetch_chunk(chunk: list[str]) -> dict[str, RepoStats]:
+        if bucket:
+            bucket.acquire()
+        return _fetch_repo_stats_graphql(chunk, token or "")
+
+    found: dict[str, RepoStats] = {}
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        if backend == "graphql":
+            chunks = [
+                repos[i : i + GRAPHQL_BATCH_SIZE]
+                for i in range(0, len(repos), GRAPHQL_BATCH_SIZE)
+            ]
+            for chunk_stats in pool.map(fetch_chunk, chunks):
+                found.update(chunk_stats)
+
+        missing = [r for r in repos if r not in found]
+        for repo, stats in zip(missing, pool.map(fetch, missing)):
+            if stats:
+                found[repo] = stats
+
+    return {repo: found[repo] for repo in repos if repo in found}
+
+
+class _StatsStore:
+    """Last known good RepoStats per repo, with the time each was fetched.
+
+    Repos fetched within the TTL are not requested again, and a repo whose
+    fetch fails keeps its previous value instead of dropping out of the
+    dashboard, but only while that value is younger than `max_age`: a repo
+    that was deleted or renamed stops failing over to old numbers.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        if path.exists():
+            try:
+                loaded = json.loads(path.read_text(encoding="utf-8"))
+                if isinstance(loaded, dict):
+                    self._entries = loaded.get("repos") or {}
+            except Exception:
+                pass
+
+    def _age(self, repo: str) -> timedelta | None:
+        entry = self._entries.get(repo)
+        if not entry:
+            return None
+        try:
+            return datetime.now(timezone.utc) - _parse_github_datetime(entry["fetched"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def get(self, repo: str, max_age: timedelta | None = None) -> RepoStats | None:
+        entry = self._entries.get(repo)
+        if not entry:
+            return None
+        if max_age is not None:
+            age = self._age(repo)
+            if age is None or age >= max_age:
+                return None
+        try:
+            return RepoStats(stars=int(entry["stars"]), pushed_at=_parse_github_datetime(entry["pushed_at"]))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def is_fresh(self, repo: str, ttl: timedelta) -> bool:
+        if ttl <= timedelta(0):
+            return False
+        age = self._age(repo)
+        return age is not None and age < ttl
+
+    def put(self, repo: str, stats: RepoStats, fetched: datetime | None = None) -> None:
+        fetched = fetched or datetime.now(timezone.utc)
+        self._entries[repo] = {
+            "stars": stats.stars,
+            "pushed_at": stats.pushed_at.isoformat(),
+            "fetched": fetched.isoformat(timespec="seconds"),
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        payload = {"repos": self._entries}
+        _atomic_write_text(self.path, json.dumps(payload, indent=2, sort_keys=True))
+        self._dirty = False
 
 
 def _format_k(n: int) -> str:
@@ -229,28 +1211,223 @@ def _format_k(n: int) -> str:
     return f"{n/1_000_000:.1f}m"
 
 
-def _split_into_columns(categories: list[Category]) -> tuple[list[Category], list[Category]]:
-    # Greedy balance by total blocks (category header + project rows).
-    cats_sorted = sorted(categories, key=lambda c: len(c.projects), reverse=True)
-    cols: list[list[Category]] = [[], []]
-    load = [0, 0]
+# Dashboard block heights (px); a category costs its header plus one row per project.
+DASH_TITLE_H = 70
+DASH_CAT_H = 34
+DASH_PROJ_H = 46
+DASH_GAP_Y = 10
+DASH_COL_W = 558
+
+# Above this many categories the exact partitioner gives way to Karmarkar-Karp.
+PARTITION_EXACT_MAX = 16
+
+
+def _category_height(c: Category) -> int:
+    return DASH_CAT_H + DASH_GAP_Y + len(c.projects) * DASH_PROJ_H + DASH_GAP_Y
+
+
+def _partition_exact(weights: list[int], n: int) -> list[int]:
+    """Assign items to `n` bins minimizing the largest bin; returns bin per item.
+
+    DP over the multiset of bin loads, placing items heaviest first. Load
+    vectors are kept sorted so permutations of bins collapse into one state,
+    and states that already exceed the Karmarkar-Karp bound are pruned.
+    """
+    bound = max(_bin_loads(weights, _partition_kk(weights, n), n))
+    order = sorted(range(len(weights)), key=lambda i: -weights[i])
+
+    # state (sorted loads) -> assignment so far (bin per placed item, in `order`)
+    states: dict[tuple[int, ...], tuple[int, ...]] = {tuple([0] * n): ()}
+    for i in order:
+        nxt: dict[tuple[int, ...], tuple[int, ...]] = {}
+        for loads, assign in states.items():
+            for b in range(n):
+                if b and loads[b] == loads[b - 1]:
+                    continue  # Same load as the previous bin: symmetric.
+                new = list(loads)
+                new[b] += weights[i]
+                if new[b] > bound:
+                    continue
+                # Track where each bin moves when re-sorting.
+                perm = sorted(range(n), key=lambda k: (new[k], k))
+                key = tuple(new[k] for k in perm)
+                if key not in nxt:
+                    where = {old: pos for pos, old in enumerate(perm)}
+                    nxt[key] = tuple(where[a] for a in assign) + (where[b],)
+        if not nxt:
+            # Nothing fits under the heuristic bound; it is optimal.
+            return _partition_kk(weights, n)
+        states = nxt
+
+    best = min(states, key=lambda loads: loads[-1])
+    out = [0] * len(weights)
+    for i, b in zip(order, states[best]):
+        out[i] = b
+    return out
+
+
+def _partition_kk(weights: list[int], n: int) -> list[int]:
+    """Multiway Karmarkar-Karp (largest differencing); returns bin per item."""
+    # Heap of partial partitions: (-spread, tiebreak, [(load, items), ...] sorted by load).
+    heap: list[tuple[int, int, list[tuple[int, list[int]]]]] = []
+    for i, w in enumerate(weights):
+        bins = [(0, []) for _ in range(n - 1)] + [(w, [i])]
+        heapq.heappush(heap, (-w, i, bins))
+
+    counter = len(weights)
+    while len(heap) > 1:
+        _, _, a = heapq.heappop(heap)
+        _, _, b = heapq.heappop(heap)
+        # Pair a's heaviest bin with b's lightest, and so on.
+        merged = [(la + lb, ia + ib) for (la, ia), (lb, ib) in zip(a, reversed(b))]
+        merged.sort(key=lambda x: x[0])
+        low = merged[0][0]
+        merged = [(load - low, items) for load, items in merged]
+        heapq.heappush(heap, (-(merged[-1][0]), counter, merged))
+        counter += 1
+
+    out = [0] * len(weights)
+    if heap:
+        for b, (_, items) in enumerate(heap[0][2]):
+            for i in items:
+                out[i] = b
+    return out
+
+
+def _bin_loads(weights: list[int], assign: list[int], n: int) -> list[int]:
+    loads = [0] * n
+    for w, b in zip(weights, assign):
+        loads[b] += w
+    return loads
+
+
+def _split_into_columns(categories: list[Category], n: int = 2) -> list[list[Category]]:
+    """Split categories into `n` columns, minimizing the tallest column.
+
+    Exact for up to PARTITION_EXACT_MAX categories, Karmarkar-Karp beyond.
+    Categories keep their catalog order within each column, and columns are
+    ordered by their first category.
+    """
+    if n <= 1 or not categories:
+        return [list(categories)] + [[] for _ in range(max(0, n - 1))]
+
+    weights = [_category_height(c) for c in categories]
+    if len(categories) <= PARTITION_EXACT_MAX:
+        assign = _partition_exact(weights, n)
+    else:
+        assign = _partition_kk(weights, n)
 
-    for c in cats_sorted:
-        idx = 0 if load[0] <= load[1] else 1
-        cols[idx].append(c)
-        load[idx] += 1 + len(c.projects)
+    cols: list[list[Category]] = [[] for _ in range(n)]
+    for c, b in zip(categories, assign):
+        cols[b].append(c)
+    # Items were appended in catalog order; order columns by their first item.
+    order = {id(c): i for i, c in enumerate(categories)}
+    cols.sort(key=lambda col: order[id(col[0])] if col else len(categories))
+    return cols
 
-    # Preserve original ordering within each column.
-    order = {c.id: i for i, c in enumerate(categories)}
-    for col in cols:
-        col.sort(key=lambda c: order.get(c.id, 0))
 
-    return cols[0], cols[1]
+def _svg_text(x: float, y: float, text: str, cls: str, anchor: str | None = None) -> str:
+    return _svg_text_escaped(x, y, _esc(text), cls, anchor)
 
 
-def _svg_text(x: float, y: float, text: str, cls: str, anchor: str | None = None) -> str:
+def _svg_text_escaped(x: float, y: float, text: str, cls: str, anchor: str | None = None) -> str:
     anchor_attr = f' text-anchor="{anchor}"' if anchor else ""
-    return f'<text x="{x}" y="{y}" class="{cls}"{anchor_attr}>{_esc(text)}</text>'
+    return f'<text x="{x}" y="{y}" class="{cls}"{anchor_attr}>{text}</text>'
+
+
+# Max description length per dashboard layout.
+DESC_MAX_LEN = {"desktop": 92, "mobile": 110}
+
+
+@dataclass(frozen=True)
+class _DashboardRow:
+    """Pre-escaped text for one project row."""
+    name: str
+    stats: str
+    desc: dict[str, str]  # Truncated per layout.
+
+
+@dataclass(frozen=True)
+class _DashboardModel:
+    """Layout- and theme-independent dashboard text, computed once per run."""
+    categories: list[Category]
+    columns: list[list[Category]]
+    titles: dict[str, str]
+    rows: dict[str, list[_DashboardRow]]
+    total_stars: int
+    last_push: str
+
+
+def _prepare_dashboard(
+    categories: list[Category], repo_stats: dict[str, RepoStats], columns: int = 2
+) -> _DashboardModel:
+    rows: dict[str, list[_DashboardRow]] = {}
+    for cat in categories:
+        cat_rows = []
+        for proj in cat.projects:
+            is_private = proj.private or not proj.repo
+
+            stats = repo_stats.get(proj.repo or "") if proj.repo else None
+            stars_s = _format_k(stats.stars) if stats else "--"
+            pushed_s = stats.pushed_at.strftime("%Y-%m-%d") if stats else "----"
+
+            right = f"{stars_s}* {pushed_s}" if not is_private else "private"
+
+            name = proj.title
+            if is_private:
+                name = f"{name} [private]"
+
+            desc = proj.desc
+            if proj.tags:
+                desc = f"{desc} ({', '.join(proj.tags)})"
+
+            descs = {}
+            for layout, max_len in DESC_MAX_LEN.items():
+                d = desc
+                if len(d) > max_len:
+                    d = d[: max_len - 3].rstrip() + "..."
+                descs[layout] = _esc(d)
+
+            cat_rows.append(_DashboardRow(name=_esc(name), stats=_esc(right), desc=descs))
+        rows[cat.id] = cat_rows
+
+    last_push_dt = max((s.pushed_at for s in repo_stats.values()), default=None)
+    return _DashboardModel(
+        categories=categories,
+        columns=_split_into_columns(categories, columns),
+        titles={cat.id: _esc(cat.title.upper()) for cat in categories},
+        rows=rows,
+        total_stars=sum(s.stars for s in repo_stats.values()),
+        last_push=last_push_dt.strftime("%Y-%m-%d") if last_push_dt else "unknown",
+    )
+
+
+ICON_SIZE = 24
+ICON_SPRITE_NAME = "icons-sprite.svg"
+
+
+def _icon_symbol_id(name: str) -> str:
+    return "icon-" + re.sub(r"[^A-Za-z0-9_-]", "-", Path(name).stem)
+
+
+def _icon_symbols(icon_data: dict[str, str], names: list[str]) -> list[str]:
+    return [
+        f'<symbol id="{_icon_symbol_id(name)}" viewBox="0 0 {ICON_SIZE} {ICON_SIZE}">'
+        f'<image width="{ICON_SIZE}" height="{ICON_SIZE}" href="{icon_data[name]}" /></symbol>'
+        for name in names
+        if name in icon_data
+    ]
+
+
+def _render_icon_sprite_svg(*, icon_data: dict[str, str]) -> str:
+    """A standalone sprite of every category icon, for --icon-sprite."""
+    symbols = "\n  ".join(_icon_symbols(icon_data, sorted(icon_data)))
+    svg = f"""<svg xmlns="http://www.w3.org/2000/svg">
+  {symbols}
+</svg>
+"""
+    _require_ascii("icon sprite svg", svg)
+    return svg
 
 
 def _render_project_dashboard_svg(
@@ -260,11 +1437,24 @@ def _render_project_dashboard_svg(
     icon_data: dict[str, str],
     variant: str,
     layout: str,
+    model: _DashboardModel | None = None,
+    icon_sprite: str | None = None,
+    columns: int = 2,
+    page: tuple[int, int] | None = None,
 ) -> str:
+    """Render the project dashboard card.
+
+    Each category icon is emitted once as a <symbol> in <defs> and drawn with
+    <use>. With `icon_sprite`, icons are instead referenced from that shared
+    sprite file (see _render_icon_sprite_svg) and nothing is inlined.
+    `page` is (number, count) when rendering one page of a paginated dashboard.
+    """
     if variant not in ("light", "dark"):
         _die(f"Invalid variant: {variant}")
     if layout not in ("desktop", "mobile"):
         _die(f"Invalid layout: {layout}")
+    if model is None:
+        model = _prepare_dashboard(categories, repo_stats, columns=columns)
 
     if variant == "light":
         bg0 = "#f8fafc"
@@ -286,47 +1476,38 @@ def _render_project_dashboard_svg(
         accent1 = "#34d399"
 
     if layout == "desktop":
-        width = 1200
+        cols = model.columns
         pad = 28
         gap_col = 28
-        col_w = (width - pad * 2 - gap_col) / 2
-        col_left, col_right = _split_into_columns(categories)
-        columns = [col_left, col_right]
+        width = pad * 2 + DASH_COL_W * len(cols) + gap_col * (len(cols) - 1)
+        col_w = (width - pad * 2 - gap_col * (len(cols) - 1)) // len(cols)
     else:
         width = 920
         pad = 28
         gap_col = 0
         col_w = width - pad * 2
-        columns = [categories]
-
-    title_h = 70
-    cat_h = 34
-    proj_h = 46
-    gap_y = 10
-
-    def column_height(col: list[Category]) -> int:
-        h = 0
-        for c in col:
-            h += cat_h + gap_y
-            h += len(c.projects) * proj_h
-            h += gap_y
-        return h
-
-    content_h = max(column_height(col) for col in columns)
+        cols = [model.categories]
+
+    title_h = DASH_TITLE_H
+    cat_h = DASH_CAT_H
+    proj_h = DASH_PROJ_H
+    gap_y = DASH_GAP_Y
+
+    content_h = max(sum(_category_height(c) for c in col) for col in cols)
     height = int(pad * 2 + title_h + content_h + 6)
 
-    total_stars = sum(s.stars for s in repo_stats.values())
-    last_push_dt = max((s.pushed_at for s in repo_stats.values()), default=None)
-    last_push = last_push_dt.strftime("%Y-%m-%d") if last_push_dt else "unknown"
+    used_icons = list(dict.fromkeys(c.icon for col in cols for c in col if c.icon in icon_data))
+    icon_defs = ""
+    if used_icons and not icon_sprite:
+        icon_defs = "".join(f"\n    {sym}" for sym in _icon_symbols(icon_data, used_icons))
+    icon_ref = f"{icon_sprite}#" if icon_sprite else "#"
 
     parts: list[str] = []
     title_text = _svg_text(pad, pad + 34, "PROJECT DASHBOARD", "title")
-    meta_text = _svg_text(
-        pad,
-        pad + 56,
-        f"Signal: {_format_k(total_stars)} stars | Last push: {last_push} | Layout: {layout}",
-        "meta",
-    )
+    meta = f"Signal: {_format_k(model.total_stars)} stars | Last push: {model.last_push} | Layout: {layout}"
+    if page:
+        meta += f" | Page {page[0]}/{page[1]}"
+    meta_text = _svg_text(pad, pad + 56, meta, "meta")
     parts.append(
         (
             """<svg xmlns="http://www.w3.org/2000/svg" width="%(width)d" height="%(height)d" viewBox="0 0 %(width)d %(height)d" role="img" aria-labelledby="title desc">
@@ -354,7 +1535,7 @@ def _render_project_dashboard_svg(
       .name { font: 800 15px ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace; fill: %(text)s; }
       .desc { font: 600 12px ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Arial; fill: %(muted)s; }
       .stats { font: 800 12px ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace; fill: %(subtle)s; }
-    ]]></style>
+    ]]></style>%(icon_defs)s
   </defs>
 
   <rect x="0" y="0" width="%(width)d" height="%(height)d" rx="18" fill="url(#bg)" />
@@ -385,6 +1566,7 @@ def _render_project_dashboard_svg(
                 "title_h": title_h,
                 "title_text": title_text,
                 "meta_text": meta_text,
+                "icon_defs": icon_defs,
             }
         )
     )
@@ -395,43 +1577,21 @@ def _render_project_dashboard_svg(
             parts.append(
                 f'<rect x="{x0}" y="{y}" width="{col_w}" height="{cat_h}" rx="10" fill="url(#hdr)" opacity="0.92" />'
             )
-            icon_href = icon_data.get(cat.icon or "")
             text_x = x0 + 14
-            if icon_href:
+            if cat.icon in icon_data:
                 parts.append(
-                    f'<image x="{x0 + 10}" y="{y + 5}" width="24" height="24" href="{icon_href}" />'
+                    f'<use x="{x0 + 10}" y="{y + 5}" width="{ICON_SIZE}" height="{ICON_SIZE}" href="{icon_ref}{_icon_symbol_id(cat.icon)}" />'
                 )
                 text_x = x0 + 44
-            parts.append(_svg_text(text_x, y + 22, cat.title.upper(), "cat"))
+            parts.append(_svg_text_escaped(text_x, y + 22, model.titles[cat.id], "cat"))
             y += cat_h + gap_y
 
-            for proj in cat.projects:
-                is_private = proj.private or not proj.repo
-
-                stats = repo_stats.get(proj.repo or "") if proj.repo else None
-                stars_s = _format_k(stats.stars) if stats else "--"
-                pushed_s = stats.pushed_at.strftime("%Y-%m-%d") if stats else "----"
-
-                right = f"{stars_s}* {pushed_s}" if not is_private else "private"
-
-                name = proj.title
-                if is_private:
-                    name = f"{name} [private]"
-
+            for row in model.rows[cat.id]:
                 name_y = y + 17
                 desc_y = y + 36
-                parts.append(_svg_text(x0 + 12, name_y, name, "name"))
-                parts.append(_svg_text(x0 + col_w - 12, name_y, right, "stats", anchor="end"))
-
-                desc = proj.desc
-                if proj.tags:
-                    desc = f"{desc} ({', '.join(proj.tags)})"
-
-                max_len = 92 if layout == "desktop" else 110
-                if len(desc) > max_len:
-                    desc = desc[: max_len - 3].rstrip() + "..."
-
-                parts.append(_svg_text(x0 + 12, desc_y, desc, "desc"))
+                parts.append(_svg_text_escaped(x0 + 12, name_y, row.name, "name"))
+                parts.append(_svg_text_escaped(x0 + col_w - 12, name_y, row.stats, "stats", anchor="end"))
+                parts.append(_svg_text_escaped(x0 + 12, desc_y, row.desc[layout], "desc"))
                 parts.append(
                     f'<line x1="{x0 + 10}" y1="{y + proj_h}" x2="{x0 + col_w - 10}" y2="{y + proj_h}" stroke="{border}" stroke-width="1" opacity="0.35" />'
                 )
@@ -441,13 +1601,8 @@ def _render_project_dashboard_svg(
             y += gap_y
 
     y_start = pad + title_h + 10
-    if layout == "desktop":
-        x_left = pad
-        x_right = pad + col_w + gap_col
-        render_column(columns[0], x_left, y_start)
-        render_column(columns[1], x_right, y_start)
-    else:
-        render_column(columns[0], pad, y_start)
+    for i, col in enumerate(cols):
+        render_column(col, pad + i * (col_w + gap_col), y_start)
 
     parts.append("</svg>\n")
 
@@ -456,6 +1611,89 @@ def _render_project_dashboard_svg(
     return svg
 
 
+# Fixed chrome around dashboard columns: outer padding, title block, bottom margin.
+DASH_CHROME_H = 28 * 2 + DASH_TITLE_H + 6
+
+
+def _paginate_categories(categories: list[Category], columns: int, page_height: int) -> list[list[Category]]:
+    """Split categories, in catalog order, into pages no taller than `page_height`.
+
+    A page takes categories while its tallest column (after balancing across
+    `columns`) still fits; a single category taller than a page gets a page
+    of its own.
+    """
+    budget = page_height - DASH_CHROME_H
+    pages: list[list[Category]] = []
+    page: list[Category] = []
+    total = 0
+    for cat in categories:
+        h = _category_height(cat)
+        if page:
+            fits = total + h <= budget * columns
+            if fits and columns > 1:
+                cols = _split_into_columns(page + [cat], columns)
+                fits = max(sum(_category_height(c) for c in col) for col in cols) <= budget
+            if not fits:
+                pages.append(page)
+                page, total = [], 0
+        page.append(cat)
+        total += h
+    if page:
+        pages.append(page)
+    return pages
+
+
+def _render_dashboard_index_svg(
+    *, pages: list[list[Category]], variant: str, layout: str, total_stars: int, last_push: str
+) -> str:
+    """Render the index card for a paginated dashboard: one line per page."""
+    if variant not in ("light", "dark"):
+        _die(f"Invalid variant: {variant}")
+
+    if variant == "light":
+        bg, border, text, subtle = "#ffffff", "#cbd5e1", "#0f172a", "#64748b"
+    else:
+        bg, border, text, subtle = "#0b1227", "#26324a", "#e2e8f0", "#94a3b8"
+
+    width = 1200 if layout == "desktop" else 920
+    pad = 28
+    line_h = 26
+    height = pad * 2 + DASH_TITLE_H + line_h * len(pages)
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}" role="img" aria-labelledby="title desc">',
+        '  <title id="title">Project dashboard index</title>',
+        '  <desc id="desc">Pages of the project dashboard and the categories on each.</desc>',
+        "  <style><![CDATA[",
+        f"    .title {{ font: 800 28px ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Arial; fill: {text}; }}",
+        f"    .meta {{ font: 600 13px ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Arial; fill: {subtle}; }}",
+        f"    .page {{ font: 800 13px ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, monospace; fill: {text}; }}",
+        "  ]]></style>",
+        f'  <rect x="0" y="0" width="{width}" height="{height}" rx="18" fill="{bg}" stroke="{border}" stroke-width="2" />',
+        _svg_text(pad, pad + 34, "PROJECT DASHBOARD", "title"),
+        _svg_text(
+            pad,
+            pad + 56,
+            f"Signal: {_format_k(total_stars)} stars | Last push: {last_push} | {len(pages)} pages",
+            "meta",
+        ),
+    ]
+    max_len = DESC_MAX_LEN[layout]
+    y = pad + DASH_TITLE_H + 18
+    for i, page in enumerate(pages, start=1):
+        count = sum(len(c.projects) for c in page)
+        line = f"Page {i}: {count} projects | " + ", ".join(c.title.upper() for c in page)
+        if len(line) > max_len:
+            line = line[: max_len - 3].rstrip() + "..."
+        parts.append(_svg_text(pad, y, line, "page"))
+        y += line_h
+    parts.append("</svg>\n")
+
+    svg = "\n".join(parts)
+    _require_ascii(f"dashboard index svg ({variant},{layout})", svg)
+    return svg
+
+
 def _render_typing_philosophy_svg(*, variant: str) -> str:
     if variant not in ("light", "dark"):
         _die(f"Invalid variant: {variant}")
@@ -597,6 +1835,174 @@ def _write_if_changed(path: Path, content: str) -> bool:
     return True
 
 
+_COORD_ATTR_RE = re.compile(r'(\s(?:x|y|x1|y1|x2|y2|width|height)=)"(-?\d+\.\d+)"')
+_ELEMENT_RE = re.compile(r"<(line|rect|path|circle|ellipse|use|image)\b([^>]*?)\s*(/?)>")
+_ATTR_RE = re.compile(r'\s([\w:-]+)="([^"]*)"')
+_CSS_RULE_RE = re.compile(r"\.([\w-]+)\{([^{}]*)\}")
+_FONT_DECL_RE = re.compile(r"font:(\d+) (\d+px) ([^;]+)")
+# Presentation attributes that are also CSS properties, and so can move to a class.
+_HOISTABLE_ATTRS = ("fill", "stroke", "stroke-width", "opacity", "fill-opacity", "stroke-opacity")
+
+
+def _minify_svg(svg: str) -> str:
+    """Minify one of our generated SVGs.
+
+    Rounds coordinates to one decimal, hoists presentation attributes that
+    repeat across elements into shared CSS classes, splits repeated `font:`
+    stacks into one shared font-family rule, and collapses whitespace
+    between tags. This relies on the shape of our own templates (one
+    <style> block, no presentation attributes on classed elements); it is
+    not a general-purpose SVG minifier.
+    """
+
+    def round_coord(m: re.Match[str]) -> str:
+        return f'{m.group(1)}"{float(m.group(2)):.1f}"'.replace('.0"', '"')
+
+    svg = _COORD_ATTR_RE.sub(round_coord, svg)
+
+    # Hoist repeated presentation attribute sets into classes.
+    def presentation(attrs: str) -> tuple[tuple[str, str], ...]:
+        pairs = _ATTR_RE.findall(attrs)
+        if any(k == "class" for k, _ in pairs):
+            return ()
+        return tuple((k, v) for k, v in pairs if k in _HOISTABLE_ATTRS)
+
+    counts: dict[tuple[tuple[str, str], ...], int] = {}
+    for m in _ELEMENT_RE.finditer(svg):
+        key = presentation(m.group(2))
+        if key:
+            counts[key] = counts.get(key, 0) + 1
+    classes = {key: f"p{i}" for i, key in enumerate(k for k, n in counts.items() if n > 1)}
+
+    def hoist(m: re.Match[str]) -> str:
+        key = presentation(m.group(2))
+        if key not in classes:
+            return m.group(0)
+        attrs = "".join(
+            f' {k}="{v}"' for k, v in _ATTR_RE.findall(m.group(2)) if k not in _HOISTABLE_ATTRS
+        )
+        return f'<{m.group(1)}{attrs} class="{classes[key]}"{m.group(3)}>'
+
+    svg = _ELEMENT_RE.sub(hoist, svg)
+
+    def compact_css(css: str) -> str:
+        css = re.sub(r"\s+", " ", css).strip()
+        css = re.sub(r"\s*([{};:,])\s*", r"\1", css)
+        css = re.sub(r"(?<=[:\s])0\.(\d)", r".\1", css).replace(";}", "}")
+
+        # Split `font: W S FAMILY` so each family stack is written once.
+        families: dict[str, list[str]] = {}
+        for cls, body in _CSS_RULE_RE.findall(css):
+            fm = _FONT_DECL_RE.search(body)
+            if fm:
+                families.setdefault(fm.group(3), []).append(cls)
+
+        def split_font(m: re.Match[str]) -> str:
+            cls, body = m.group(1), m.group(2)
+            fm = _FONT_DECL_RE.search(body)
+            if not fm or len(families[fm.group(3)]) < 2:
+                return m.group(0)
+            body = body.replace(fm.group(0), f"font-weight:{fm.group(1)};font-size:{fm.group(2)}")
+            return f".{cls}{{{body}}}"
+
+        css = _CSS_RULE_RE.sub(split_font, css)
+        shared = "".join(
+            ",".join(f".{c}" for c in clss) + f"{{font-family:{family}}}"
+            for family, clss in families.items()
+            if len(clss) > 1
+        )
+        hoisted = "".join(
+            f".{name}{{" + ";".join(f"{k}:{v}" for k, v in key) + "}" for key, name in classes.items()
+        )
+        return shared + css + hoisted
+
+    m = re.search(r"<style><!\[CDATA\[(.*?)\]\]></style>", svg, re.DOTALL)
+    if m:
+        svg = svg[: m.start(1)] + compact_css(m.group(1)) + svg[m.end(1) :]
+    elif classes:
+        svg = re.sub(r"(<svg\b[^>]*>)", lambda sm: sm.group(1) + f"<style>{compact_css('')}</style>", svg, count=1)
+
+    svg = re.sub(r">\s+<", "><", svg)
+    svg = re.sub(r'"\s+/>', '"/>', svg)
+    return svg.strip() + "\n"
+
+
+# Default per-asset byte budgets, matched by longest file name prefix.
+SVG_BYTE_BUDGETS: dict[str, int] = {
+    "projects-": 64_000,
+    "portal-badge-": 4_000,
+    "typing-philosophy-": 2_000,
+    ICON_SPRITE_NAME: 64_000,
+}
+
+
+def _over_budget(sizes: dict[str, int], budgets: dict[str, int]) -> list[str]:
+    """Return a message for every asset larger than its budget."""
+    problems = []
+    for name, size in sorted(sizes.items()):
+        prefixes = [p for p in budgets if name.startswith(p)]
+        if not prefixes:
+            continue
+        budget = budgets[max(prefixes, key=len)]
+        if size > budget:
+            problems.append(f"{name}: {size} bytes exceeds budget of {budget}")
+    return problems
+
+
+def _fingerprint(*parts: Any) -> str:
+    material = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class _BuildManifest:
+    """Records, per output file, a hash of its render inputs and of its content.
+
+    An output whose inputs hash matches and whose file still exists is not
+    re-rendered; when a render produces content identical to the recorded
+    hash, the existing file is neither read back nor rewritten.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, dict[str, str]] = {}
+        self._dirty = False
+        if path.exists():
+            try:
+                loaded = json.loads(path.read_text(encoding="utf-8"))
+                if isinstance(loaded, dict):
+                    self._entries = loaded
+            except Exception:
+                pass
+
+    def is_fresh(self, key: str, inputs: str, out_path: Path) -> bool:
+        entry = self._entries.get(key)
+        return bool(entry) and entry.get("inputs") == inputs and out_path.exists()
+
+    def write(self, key: str, inputs: str, out_path: Path, content: str) -> bool:
+        """Write `content` if it differs from the recorded output; return True if written."""
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        entry = self._entries.get(key)
+        if entry and entry.get("output") == digest and out_path.exists():
+            written = False
+        else:
+            written = _write_if_changed(out_path, content)
+        new_entry = {"inputs": inputs, "output": digest}
+        if entry != new_entry:
+            self._entries[key] = new_entry
+            self._dirty = True
+        return written
+
+    def forget(self, key: str) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        _atomic_write_text(self.path, json.dumps(self._entries, indent=2, sort_keys=True))
+        self._dirty = False
+
+
 @dataclass
 class RepoContext:
     """Rich context about a repo for LLM summarization."""
@@ -623,52 +2029,68 @@ def _fetch_repo_context(repo: str, token: str | None) -> RepoContext | None:
 
     def fetch_json(url: str) -> dict | list | None:
         try:
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                return json.loads(resp.read().decode("utf-8"))
+            return _SESSION.request("GET", url, headers=headers, timeout=15).json()
         except Exception:
             return None
 
-    # 1. Repo metadata
-    meta = fetch_json(f"https://api.github.com/repos/{repo}")
-    if not meta or not isinstance(meta, dict):
-        return None
+    def decode_blob(data: dict | list | None) -> str | None:
+        if not isinstance(data, dict) or not data.get("content"):
+            return None
+        try:
+            return base64.b64decode(data["content"]).decode("utf-8", errors="replace")
+        except Exception:
+            return None
 
-    # 2. README content and SHA
-    readme_data = fetch_json(f"https://api.github.com/repos/{repo}/readme")
-    readme_content = ""
-    readme_sha = ""
-    if readme_data and isinstance(readme_data, dict):
-        readme_sha = readme_data.get("sha", "")
-        if readme_data.get("content"):
-            try:
-                readme_content = base64.b64decode(readme_data["content"]).decode("utf-8", errors="replace")
-            except Exception:
-                pass
+    api = f"{GITHUB_API}/repos/{repo}"
+    config_files = ["package.json", "Cargo.toml", "pyproject.toml", "go.mod", "setup.py"]
 
-    # 3. Languages
-    languages = fetch_json(f"https://api.github.com/repos/{repo}/languages")
-    if not isinstance(languages, dict):
-        languages = {}
+    with ThreadPoolExecutor(max_workers=len(config_files) + 1) as pool:
+        # 1-3. Repo metadata, languages and the top-level tree are independent.
+        meta_f = pool.submit(fetch_json, api)
+        languages_f = pool.submit(fetch_json, f"{api}/languages")
+        tree_f = pool.submit(fetch_json, f"{api}/git/trees/HEAD")
 
-    # 4. Directory structure (top-level)
-    tree = fetch_json(f"https://api.github.com/repos/{repo}/contents")
-    structure = []
-    if isinstance(tree, list):
-        structure = [f["name"] for f in tree if isinstance(f, dict) and "name" in f][:20]
+        meta = meta_f.result()
+        if not meta or not isinstance(meta, dict):
+            return None
 
-    # 5. Config file snippets
-    config_files = ["package.json", "Cargo.toml", "pyproject.toml", "go.mod", "setup.py"]
-    config_snippets: dict[str, str] = {}
-    for cf in config_files:
-        if cf in structure:
-            content_data = fetch_json(f"https://api.github.com/repos/{repo}/contents/{cf}")
-            if content_data and isinstance(content_data, dict) and content_data.get("content"):
-                try:
-                    decoded = base64.b64decode(content_data["content"]).decode("utf-8", errors="replace")
-                    config_snippets[cf] = decoded[:800]
-                except Exception:
-                    pass
+        languages = languages_f.result()
+        if not isinstance(languages, dict):
+            languages = {}
+
+        tree = tree_f.result()
+        entries = tree.get("tree", []) if isinstance(tree, dict) else []
+        blobs = {
+            e["path"]: e["sha"]
+            for e in entries
+            if isinstance(e, dict) and e.get("type") == "blob" and "path" in e and "sha" in e
+        }
+        structure = [e["path"] for e in entries if isinstance(e, dict) and "path" in e][:20]
+
+        # 4. README and config files: fetch every blob at once via the Git blobs API.
+        readmes = sorted(
+            (name for name in blobs if name.lower().startswith("readme")),
+            key=lambda name: (name.lower() != "readme.md", name),
+        )
+        readme_sha = blobs[readmes[0]] if readmes else ""
+        readme_f = pool.submit(fetch_json, f"{api}/git/blobs/{readme_sha}" if readme_sha else f"{api}/readme")
+        config_fs = {
+            cf: pool.submit(fetch_json, f"{api}/git/blobs/{blobs[cf]}")
+            for cf in config_files
+            if cf in blobs
+        }
+
+        readme_data = readme_f.result()
+        if not readme_sha and isinstance(readme_data, dict):
+            # No README at the root; /readme also looks in docs/ and .github/.
+            readme_sha = readme_data.get("sha", "")
+        readme_content = decode_blob(readme_data) or ""
+
+        config_snippets: dict[str, str] = {}
+        for cf, fut in config_fs.items():
+            decoded = decode_blob(fut.result())
+            if decoded:
+                config_snippets[cf] = decoded[:800]
 
     return RepoContext(
         repo=repo,
@@ -682,16 +2104,21 @@ def _fetch_repo_context(repo: str, token: str | None) -> RepoContext | None:
     )
 
 
-def _generate_description_llm(ctx: RepoContext, token: str) -> str | None:
-    """Generate a repo description using GitHub Models."""
-    # Build context prompt
+MODELS_URL = "https://models.inference.ai.azure.com/chat/completions"
+DESC_MODEL = "gpt-4o-mini"
+DESC_MAX_CHARS = 140  # Asked of the model.
+DESC_HARD_LIMIT = 160  # Enforced on its output.
+DESC_MAX_TOKENS = 100
+DESC_TEMPERATURE = 0.3
+
+
+def _repo_context_prompt(ctx: RepoContext) -> str:
+    """The per-repo part of a description prompt."""
     lang_str = ", ".join(sorted(ctx.languages.keys(), key=lambda k: -ctx.languages[k])[:5])
     topics_str = ", ".join(ctx.topics[:8]) if ctx.topics else "none"
     structure_str = ", ".join(ctx.structure[:15])
 
-    prompt = f"""Write a 1-line description (max 140 chars) for this GitHub repo. Be specific about what it does, not generic. No quotes around output. Use technical terms. Mention key tech if relevant.
-
-Repo: {ctx.repo}
+    return f"""Repo: {ctx.repo}
 Existing description: {ctx.description or 'none'}
 Topics: {topics_str}
 Languages: {lang_str}
@@ -701,39 +2128,71 @@ README excerpt:
 {ctx.readme[:2500]}
 
 Config snippets:
-{json.dumps(ctx.config_snippets, indent=2)[:1000] if ctx.config_snippets else 'none'}
+{json.dumps(ctx.config_snippets, indent=2)[:1000] if ctx.config_snippets else 'none'}"""
+
+
+def _chat_completion(prompt: str, token: str, *, max_tokens: int, json_mode: bool = False) -> str:
+    """Send one user prompt to GitHub Models (OpenAI-compatible) and return the reply."""
+    payload: dict[str, Any] = {
+        "model": DESC_MODEL,
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": max_tokens,
+        "temperature": DESC_TEMPERATURE,
+    }
+    if json_mode:
+        payload["response_format"] = {"type": "json_object"}
+
+    result = _SESSION.request(
+        "POST",
+        MODELS_URL,
+        body=json.dumps(payload).encode("utf-8"),
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        },
+        timeout=30,
+    ).json()
+    return str(result.get("choices", [{}])[0].get("message", {}).get("content", "") or "")
+
+
+def _clean_description(raw: str) -> str:
+    return raw.strip().strip('"').strip("'")
+
+
+def _description_prompt(ctx: RepoContext) -> str:
+    return f"""Write a 1-line description (max {DESC_MAX_CHARS} chars) for this GitHub repo. Be specific about what it does, not generic. No quotes around output. Use technical terms. Mention key tech if relevant.
+
+{_repo_context_prompt(ctx)}
 
 Output only the description, nothing else:"""
 
-    try:
-        # Use GitHub Models API (OpenAI-compatible)
-        import urllib.request
-
-        body = json.dumps({
-            "model": "gpt-4o-mini",
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": 100,
-            "temperature": 0.3,
-        }).encode("utf-8")
-
-        req = urllib.request.Request(
-            "https://models.inference.ai.azure.com/chat/completions",
-            data=body,
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-            },
-            method="POST",
-        )
 
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            result = json.loads(resp.read().decode("utf-8"))
+def _description_fingerprint(ctx: RepoContext) -> str:
+    """Cache key for a repo description: everything that shapes the model's answer.
+
+    Batched requests are keyed by the equivalent single-repo prompt, so a
+    description is reused regardless of which batch produced it.
+    """
+    material = json.dumps(
+        {
+            "model": DESC_MODEL,
+            "max_tokens": DESC_MAX_TOKENS,
+            "temperature": DESC_TEMPERATURE,
+            "prompt": _description_prompt(ctx),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _generate_description_llm(ctx: RepoContext, token: str) -> str | None:
+    """Generate a repo description using GitHub Models."""
+    prompt = _description_prompt(ctx)
 
-        content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
-        # Clean up response
-        desc = content.strip().strip('"').strip("'")
-        if len(desc) > 160:
-            desc = desc[:157] + "..."
+    try:
+        desc = _clean_description(_chat_completion(prompt, token, max_tokens=DESC_MAX_TOKENS))
+        if len(desc) > DESC_HARD_LIMIT:
+            desc = desc[: DESC_HARD_LIMIT - 3] + "..."
         return desc if desc else None
 
     except Exception as e:
@@ -741,89 +2200,376 @@ Output only the description, nothing else:"""
         return None
 
 
-def _load_desc_cache(cache_path: Path) -> dict[str, dict]:
-    """Load cached README SHAs and descriptions."""
-    if cache_path.exists():
+def _generate_descriptions_llm_batch(
+    ctxs: list[RepoContext], token: str, max_attempts: int = 2
+) -> dict[str, str]:
+    """Generate descriptions for several repos with one GitHub Models request.
+
+    The model answers with a JSON object keyed by repo. Entries that are
+    missing, empty or longer than DESC_HARD_LIMIT are re-requested (only
+    those) up to `max_attempts` times; whatever still fails is left out.
+    """
+    pending = {ctx.repo: ctx for ctx in ctxs}
+    out: dict[str, str] = {}
+
+    for _ in range(max_attempts):
+        if not pending:
+            break
+
+        sections = "\n\n".join(
+            f"=== Repo {i} ===\n{_repo_context_prompt(ctx)}"
+            for i, ctx in enumerate(pending.values(), start=1)
+        )
+        keys = ", ".join(json.dumps(repo) for repo in pending)
+        prompt = f"""Write a 1-line description (max {DESC_MAX_CHARS} chars) for each GitHub repo below. Be specific about what each does, not generic. Use technical terms. Mention key tech if relevant.
+
+{sections}
+
+Respond with a JSON object whose keys are exactly {keys} and whose values are the descriptions. No other keys, no commentary."""
+
         try:
-            return json.loads(cache_path.read_text(encoding="utf-8"))
-        except Exception:
-            pass
-    return {}
+            content = _chat_completion(
+                prompt, token, max_tokens=80 * len(pending) + 50, json_mode=True
+            )
+            data = json.loads(content)
+        except Exception as e:
+            print(f"  LLM batch error ({len(pending)} repos): {e}")
+            continue
+        if not isinstance(data, dict):
+            continue
 
+        for repo in list(pending):
+            desc = _clean_description(str(data.get(repo) or ""))
+            if desc and len(desc) <= DESC_HARD_LIMIT:
+                out[repo] = desc
+                del pending[repo]
 
-def _save_desc_cache(cache_path: Path, cache: dict[str, dict]) -> None:
-    """Save cached README SHAs and descriptions."""
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    cache_path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    return out
 
 
-def _update_readme_descriptions(
-    readme_path: Path,
-    repos: list[str],
-    token: str | None,
-    cache_path: Path,
-) -> bool:
-    """Update Recent Work descriptions using LLM-generated summaries."""
-    import re
+class _DescCache:
+    """Content-addressed store of generated repo descriptions.
 
-    if not token or not readme_path.exists():
-        return False
+    Entries are keyed by _description_fingerprint, so a change to the README,
+    topics, languages, config files, prompt wording, model or sampling
+    parameters misses the cache. Entries unused for `ttl_days` expire and the
+    least recently used are evicted beyond `max_entries`. `latest` serves the
+    newest description for a repo without fetching its context, for callers
+    that only need *a* description. Saves are atomic.
+    """
 
-    cache = _load_desc_cache(cache_path)
-    content = readme_path.read_text(encoding="utf-8")
-    original = content
-    updated_cache = False
+    version = 2
 
-    for repo in repos:
-        if repo in MANUAL_RECENT_WORK_DESCRIPTIONS:
-            continue
-        repo_name = repo.split("/")[-1]
+    def __init__(self, path: Path, *, ttl_days: int = 90, max_entries: int = 1000) -> None:
+        self.path = path
+        self.ttl_days = ttl_days
+        self.max_entries = max_entries
+        self._entries: dict[str, dict[str, str]] = {}
+        self._today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        self._dirty = False
 
-        # Check if repo is in Recent Work section
-        pattern = rf'<dt><a href="https://github\.com/{re.escape(repo)}"><b>{re.escape(repo_name)}</b></a>.*?</dt>\s*<dd>(.*?)</dd>'
-        match = re.search(pattern, content, re.DOTALL)
-        if not match:
-            continue
+        raw: Any = None
+        if path.exists():
+            try:
+                raw = json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                pass
+        if isinstance(raw, dict) and raw.get("version") == self.version:
+            entries = raw.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+        elif isinstance(raw, dict):
+            # v1 was {repo: {"sha": readme_sha, "desc": ...}}. Its keys cannot be
+            # turned into fingerprints without refetching, so keep them only as
+            # `latest` fallbacks.
+            for repo, old in raw.items():
+                if isinstance(old, dict) and old.get("desc"):
+                    self._entries[f"legacy:{repo}"] = {
+                        "repo": repo,
+                        "desc": str(old["desc"]),
+                        "created": "",
+                        "used": self._today,
+                    }
+            self._dirty = bool(self._entries)
+
+    def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if not entry:
+            return None
+        if entry.get("used") != self._today:
+            entry["used"] = self._today
+            self._dirty = True
+        return entry["desc"]
+
+    def put(self, key: str, repo: str, desc: str) -> None:
+        created = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self._entries[key] = {"repo": repo, "desc": desc, "created": created, "used": self._today}
+        self._dirty = True
+
+    def latest(self, repo: str) -> str | None:
+        matches = [e for e in self._entries.values() if e.get("repo") == repo]
+        if not matches:
+            return None
+        entry = max(matches, key=lambda e: e.get("created", ""))
+        if entry.get("used") != self._today:
+            # Serving it counts as use, or a repo described only through
+            # `latest` would expire while still on the README.
+            entry["used"] = self._today
+            self._dirty = True
+        return entry["desc"]
+
+    def _evict(self) -> None:
+        cutoff = (
+            datetime.now(timezone.utc) - timedelta(days=self.ttl_days)
+        ).strftime("%Y-%m-%d")
+        live = {k: e for k, e in self._entries.items() if e.get("used", "") >= cutoff}
+        if len(live) > self.max_entries:
+            keep = sorted(live, key=lambda k: (live[k].get("used", ""), live[k].get("created", "")))
+            for k in keep[: len(live) - self.max_entries]:
+                del live[k]
+        if len(live) != len(self._entries):
+            self._entries = live
+            self._dirty = True
+
+    def save(self) -> None:
+        self._evict()
+        if not self._dirty:
+            return
+        _atomic_write_text(
+            self.path,
+            json.dumps({"version": self.version, "entries": self._entries}, indent=2, sort_keys=True),
+        )
+        self._dirty = False
 
-        print(f"  Checking {repo}...")
-        ctx = _fetch_repo_context(repo, token)
-        if not ctx or not ctx.readme_sha:
-            continue
 
-        # Check cache - skip if README unchanged
-        cached = cache.get(repo, {})
-        if cached.get("sha") == ctx.readme_sha and cached.get("desc"):
-            print(f"    Cache hit (README unchanged)")
-            continue
+_DT_DD_RE = re.compile(
+    r'(?P<dt><dt><a href="https://github\.com/(?P<repo>[^"/\s]+/(?P<name>[^"/\s]+))"><b>(?P=name)</b></a>[^\n]*?</dt>)'
+    r"(?P<sep>\s*)<dd>(?P<dd>.*?)</dd>",
+    re.DOTALL,
+)
+_RECENT_WORK_HEADING_RE = re.compile(r'^## <img src="\.github/assets/icons/toolbox\.png"[^>]*> Recent Work')
+_RECENT_WORK_RE = re.compile(
+    r'(## <img src="\.github/assets/icons/toolbox\.png"[^>]*> Recent Work\s*\n\n)<dl>.*?</dl>', re.DOTALL
+)
 
-        # Generate new description
-        print(f"    Generating description via LLM...")
-        new_desc = _generate_description_llm(ctx, token)
-        if not new_desc:
-            continue
 
-        # Update cache
-        cache[repo] = {"sha": ctx.readme_sha, "desc": new_desc}
-        updated_cache = True
+@dataclass
+class _DlEntry:
+    """A `<dt><a href=repo><b>name</b></a>...</dt> <dd>...</dd>` pair."""
+    repo: str
+    dt: str
+    sep: str
+    dd: str
 
-        # Replace description in README
-        old_dd = match.group(1).strip()
-        new_dd = new_desc
+    def render(self) -> str:
+        return f"{self.dt}{self.sep}<dd>{self.dd}</dd>"
 
-        # Preserve any HTML tags/abbr in original if new desc is plain
-        # For now, just do plain replacement
-        full_match = match.group(0)
-        new_full = full_match.replace(f"<dd>{old_dd}</dd>", f"<dd>{new_desc}</dd>")
-        content = content.replace(full_match, new_full)
-        print(f"    Updated: {new_desc[:80]}...")
 
-    if updated_cache:
-        _save_desc_cache(cache_path, cache)
+@dataclass
+class _ReadmeSection:
+    heading: str  # The "## ..." line, or "" for text before the first heading.
+    parts: list[str | _DlEntry]
+
+    @classmethod
+    def parse(cls, text: str) -> _ReadmeSection:
+        parts: list[str | _DlEntry] = []
+        pos = 0
+        for m in _DT_DD_RE.finditer(text):
+            parts.append(text[pos : m.start()])
+            parts.append(_DlEntry(repo=m.group("repo"), dt=m.group("dt"), sep=m.group("sep"), dd=m.group("dd")))
+            pos = m.end()
+        parts.append(text[pos:])
+        heading = text.split("\n", 1)[0] if text.startswith("## ") else ""
+        return cls(heading=heading, parts=parts)
+
+    def render(self) -> str:
+        return "".join(p if isinstance(p, str) else p.render() for p in self.parts)
+
+
+class _ReadmeDoc:
+    """README.md parsed once into `## ` sections and <dt>/<dd> entries by repo.
+
+    The Recent Work rotation, description and star passes all edit this model
+    in memory; `save` serializes and writes it exactly once.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.exists = path.exists()
+        self.original = path.read_text(encoding="utf-8") if self.exists else ""
+        chunks = re.split(r"(?m)^(?=## )", self.original)
+        self.sections = [_ReadmeSection.parse(chunk) for chunk in chunks if chunk]
+        self._index()
+
+    def _index(self) -> None:
+        # First occurrence wins, matching a top-to-bottom search of the text.
+        self.entries: dict[str, _DlEntry] = {}
+        for section in self.sections:
+            for part in section.parts:
+                if isinstance(part, _DlEntry):
+                    self.entries.setdefault(part.repo, part)
+
+    def find_section(self, pattern: re.Pattern[str]) -> int | None:
+        for i, section in enumerate(self.sections):
+            if section.heading and pattern.search(section.heading):
+                return i
+        return None
 
-    if content != original:
-        readme_path.write_text(content, encoding="utf-8")
+    def replace_section(self, index: int, text: str) -> None:
+        self.sections[index] = _ReadmeSection.parse(text)
+        self._index()
+
+    def render(self) -> str:
+        return "".join(section.render() for section in self.sections)
+
+    def save(self) -> bool:
+        if not self.exists:
+            return False
+        content = self.render()
+        if content == self.original:
+            return False
+        self.path.write_text(content, encoding="utf-8")
+        self.original = content
         return True
-    return False
+
+
+def _describe_repos(
+    repos: list[str],
+    token: str,
+    *,
+    is_fresh: Callable[[RepoContext], bool] = lambda ctx: False,
+    context_workers: int = 4,
+    llm_workers: int = 2,
+    batch_size: int = 1,
+) -> dict[str, tuple[RepoContext, str]]:
+    """Fetch repo contexts and generate descriptions as a two-stage pipeline.
+
+    Context fetches run on one pool; finished contexts go to a separately
+    bounded LLM pool, so model calls overlap with the remaining fetches.
+    With `batch_size` > 1, contexts are grouped into batched model requests.
+    Contexts for which `is_fresh` returns True skip the model.
+    Returns {repo: (ctx, description)} for every description generated.
+    """
+    results: dict[str, tuple[RepoContext, str]] = {}
+
+    def generate(batch: list[RepoContext]) -> None:
+        if len(batch) == 1:
+            desc = _generate_description_llm(batch[0], token)
+            descs = {batch[0].repo: desc} if desc else {}
+        else:
+            descs = _generate_descriptions_llm_batch(batch, token)
+        for ctx in batch:
+            desc = descs.get(ctx.repo)
+            if desc:
+                results[ctx.repo] = (ctx, desc)
+                print(f"    {ctx.repo}: {desc[:80]}...")
+
+    with (
+        ThreadPoolExecutor(max_workers=max(1, context_workers)) as ctx_pool,
+        ThreadPoolExecutor(max_workers=max(1, llm_workers)) as llm_pool,
+    ):
+        fetches = {ctx_pool.submit(_fetch_repo_context, repo, token): repo for repo in repos}
+        generations: list[Future[None]] = []
+        batch: list[RepoContext] = []
+        for fut in as_completed(fetches):
+            ctx = fut.result()
+            if not ctx:
+                continue
+            if is_fresh(ctx):
+                _TRACE.count("describe.cache_hits")
+                print(f"    {ctx.repo}: cache hit")
+                continue
+            batch.append(ctx)
+            if len(batch) >= batch_size:
+                generations.append(llm_pool.submit(generate, batch))
+                batch = []
+        if batch:
+            generations.append(llm_pool.submit(generate, batch))
+        for gen in generations:
+            gen.result()
+
+    return results
+
+
+def _update_readme_descriptions(
+    doc: _ReadmeDoc,
+    repos: list[str],
+    token: str | None,
+    cache_path: Path,
+    *,
+    context_workers: int = 4,
+    llm_workers: int = 2,
+    llm_batch_size: int = 1,
+) -> bool:
+    """Update Recent Work descriptions using LLM-generated summaries."""
+    if not token or not doc.exists:
+        return False
+
+    cache = _DescCache(cache_path)
+    generated = _generate_readme_descriptions(
+        doc,
+        repos,
+        token,
+        cache,
+        context_workers=context_workers,
+        llm_workers=llm_workers,
+        llm_batch_size=llm_batch_size,
+    )
+    changed = _apply_readme_descriptions(doc, cache, generated)
+    cache.save()
+    return changed
+
+
+def _generate_readme_descriptions(
+    doc: _ReadmeDoc,
+    repos: list[str],
+    token: str,
+    cache: _DescCache,
+    *,
+    context_workers: int = 4,
+    llm_workers: int = 2,
+    llm_batch_size: int = 1,
+) -> dict[str, tuple[str, str]]:
+    """Describe README entries among `repos` whose prompt inputs changed.
+
+    Returns {repo: (description fingerprint, description)}; neither the
+    cache nor the README is modified.
+    """
+    # Check which repos have a <dt>/<dd> entry in the README
+    targets = [
+        repo
+        for repo in repos
+        if repo not in MANUAL_RECENT_WORK_DESCRIPTIONS and repo in doc.entries
+    ]
+
+    def is_fresh(ctx: RepoContext) -> bool:
+        # Check cache - skip if nothing that feeds the prompt has changed
+        return not ctx.readme_sha or cache.get(_description_fingerprint(ctx)) is not None
+
+    print(f"  Checking {len(targets)} repos...")
+    generated = _describe_repos(
+        targets,
+        token,
+        is_fresh=is_fresh,
+        context_workers=context_workers,
+        llm_workers=llm_workers,
+        batch_size=llm_batch_size,
+    )
+    return {repo: (_description_fingerprint(ctx), desc) for repo, (ctx, desc) in generated.items()}
+
+
+def _apply_readme_descriptions(
+    doc: _ReadmeDoc, cache: _DescCache, generated: dict[str, tuple[str, str]]
+) -> bool:
+    """Record generated descriptions in `cache` and set them on README entries."""
+    changed = False
+    for repo, (key, desc) in generated.items():
+        cache.put(key, repo, desc)
+        entry = doc.entries.get(repo)
+        if entry and entry.dd != desc:
+            entry.dd = desc
+            changed = True
+    return changed
 
 
 def _get_recent_repos(repo_stats: dict[str, RepoStats], count: int = 8) -> list[tuple[str, RepoStats]]:
@@ -842,27 +2588,28 @@ def _get_recent_repos(repo_stats: dict[str, RepoStats], count: int = 8) -> list[
 
 
 def _rotate_recent_work(
-    readme_path: Path,
+    doc: _ReadmeDoc,
     repo_stats: dict[str, RepoStats],
     token: str | None,
     cache_path: Path,
     count: int = 8,
+    *,
+    context_workers: int = 4,
+    llm_workers: int = 2,
+    llm_batch_size: int = 1,
 ) -> bool:
     """Rotate Recent Work section to show the N most recently pushed repos."""
-    import re
-
-    if not readme_path.exists():
+    if not doc.exists:
         return False
 
-    content = readme_path.read_text(encoding="utf-8")
-    original = content
-
     # Find Recent Work section
-    pattern = r'(## <img src="\.github/assets/icons/toolbox\.png"[^>]*> Recent Work\s*\n\n)<dl>.*?</dl>'
-    match = re.search(pattern, content, re.DOTALL)
-    if not match:
+    index = doc.find_section(_RECENT_WORK_HEADING_RE)
+    content = doc.sections[index].render() if index is not None else ""
+    match = _RECENT_WORK_RE.search(content)
+    if index is None or not match:
         print("Warning: Could not find Recent Work section")
         return False
+    original = content
 
     header = match.group(1)
 
@@ -877,26 +2624,32 @@ def _rotate_recent_work(
         print(f"  {repo}: pushed {stats.pushed_at.strftime('%Y-%m-%d')}, {stats.stars} stars")
 
     # Load description cache
-    cache = _load_desc_cache(cache_path)
+    cache = _DescCache(cache_path)
+
+    # Generate any missing descriptions up front, concurrently.
+    missing = [
+        repo
+        for repo, _ in recent
+        if repo not in MANUAL_RECENT_WORK_DESCRIPTIONS and not cache.latest(repo)
+    ]
+    if missing and token:
+        print(f"  Generating descriptions for {len(missing)} repos...")
+        generated = _describe_repos(
+            missing,
+            token,
+            context_workers=context_workers,
+            llm_workers=llm_workers,
+            batch_size=llm_batch_size,
+        )
+        for repo, (ctx, desc) in generated.items():
+            cache.put(_description_fingerprint(ctx), repo, desc)
 
     # Build new <dl> content
     dl_items = []
     for repo, stats in recent:
         repo_name = repo.split("/")[-1]
 
-        description = MANUAL_RECENT_WORK_DESCRIPTIONS.get(repo)
-
-        if not description:
-            cached = cache.get(repo, {})
-            description = cached.get("desc")
-
-            if not description and token:
-                print(f"  Generating description for {repo}...")
-                ctx = _fetch_repo_context(repo, token)
-                if ctx:
-                    description = _generate_description_llm(ctx, token)
-                    if description:
-                        cache[repo] = {"sha": ctx.readme_sha, "desc": description}
+        description = MANUAL_RECENT_WORK_DESCRIPTIONS.get(repo) or cache.latest(repo)
 
         if not description:
             description = f"Repository: {repo}"
@@ -916,44 +2669,54 @@ def _rotate_recent_work(
     content = content[:match.start()] + new_section + content[match.end():]
 
     # Save updated cache
-    _save_desc_cache(cache_path, cache)
+    cache.save()
 
     if content != original:
-        readme_path.write_text(content, encoding="utf-8")
+        doc.replace_section(index, content)
         return True
     return False
 
 
-def _update_readme_stars(readme_path: Path, repo_stats: dict[str, RepoStats], min_stars: int = 10) -> bool:
-    """Update star counts in README.md for repos with >= min_stars."""
-    import re
-
-    if not readme_path.exists():
-        return False
+# Both star badge forms in README.md, in one alternation so a single scan
+# updates every repo:
+#   <a href="https://github.com/owner/name"><b>name</b></a> <sub>⭐NN</sub>
+#   **[name](https://github.com/owner/name)** ⭐NN
+_STAR_BADGE_RE = re.compile(
+    r'(?P<html><a href="https://github\.com/(?P<html_repo>[^"/\s]+/(?P<html_name>[^"/\s]+))"><b>(?P=html_name)</b></a>)\s*(?:<sub>⭐\d+</sub>)?'
+    r"|(?P<md>\*\*\[(?P<md_name>[^\]]+)\]\(https://github\.com/(?P<md_repo>[^)/\s]+/(?P=md_name))\)\*\*)\s*(?:⭐\d+)?"
+)
 
-    content = readme_path.read_text(encoding="utf-8")
-    original = content
 
-    for repo, stats in repo_stats.items():
-        if stats.stars < min_stars:
-            continue
-
-        repo_name = repo.split("/")[-1]
+def _update_readme_stars(doc: _ReadmeDoc, repo_stats: dict[str, RepoStats], min_stars: int = 10) -> bool:
+    """Update star counts in README.md for repos with >= min_stars."""
+    if not doc.exists:
+        return False
 
-        # Pattern 1: <sub>⭐XX</sub> after repo link
-        pattern1 = rf'(<a href="https://github\.com/{re.escape(repo)}"><b>{re.escape(repo_name)}</b></a>)\s*(?:<sub>⭐\d+</sub>)?'
-        replacement1 = rf'\1 <sub>⭐{stats.stars}</sub>'
-        content = re.sub(pattern1, replacement1, content)
+    stars = {repo: s.stars for repo, s in repo_stats.items() if s.stars >= min_stars}
+    if not stars:
+        return False
 
-        # Pattern 2: **[name](url)** ⭐XX format
-        pattern2 = rf'(\*\*\[{re.escape(repo_name)}\]\(https://github\.com/{re.escape(repo)}\)\*\*)\s*(?:⭐\d+)?'
-        replacement2 = rf'\1 ⭐{stats.stars}'
-        content = re.sub(pattern2, replacement2, content)
+    def badge(m: re.Match[str]) -> str:
+        if m.group("html"):
+            n = stars.get(m.group("html_repo"))
+            return f"{m.group('html')} <sub>⭐{n}</sub>" if n is not None else m.group(0)
+        n = stars.get(m.group("md_repo"))
+        return f"{m.group('md')} ⭐{n}" if n is not None else m.group(0)
 
-    if content != original:
-        readme_path.write_text(content, encoding="utf-8")
-        return True
-    return False
+    changed = False
+    for section in doc.sections:
+        for i, part in enumerate(section.parts):
+            if isinstance(part, str):
+                new = _STAR_BADGE_RE.sub(badge, part)
+                if new != part:
+                    section.parts[i] = new
+                    changed = True
+            else:
+                new = _STAR_BADGE_RE.sub(badge, part.dt)
+                if new != part.dt:
+                    part.dt = new
+                    changed = True
+    return changed
 
 
 def _load_png_data_uri(path: Path) -> str | None:
@@ -964,15 +2727,426 @@ def _load_png_data_uri(path: Path) -> str | None:
     return f"data:image/png;base64,{b64}"
 
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_chunks(raw: bytes) -> list[tuple[bytes, bytes]]:
+    if not raw.startswith(_PNG_SIGNATURE):
+        raise ValueError("not a PNG")
+    chunks = []
+    pos = len(_PNG_SIGNATURE)
+    while pos + 8 <= len(raw):
+        length, ctype = struct.unpack(">I4s", raw[pos : pos + 8])
+        chunks.append((ctype, raw[pos + 8 : pos + 8 + length]))
+        pos += 12 + length
+        if ctype == b"IEND":
+            break
+    return chunks
+
+
+def _png_encode(chunks: list[tuple[bytes, bytes]]) -> bytes:
+    out = [_PNG_SIGNATURE]
+    for ctype, data in chunks:
+        out.append(struct.pack(">I", len(data)) + ctype + data)
+        out.append(struct.pack(">I", zlib.crc32(ctype + data) & 0xFFFFFFFF))
+    return b"".join(out)
+
+
+def _png_strip(raw: bytes) -> bytes:
+    """Drop every ancillary chunk except transparency; recompress image data."""
+    chunks = _png_chunks(raw)
+    idat = zlib.decompress(b"".join(d for t, d in chunks if t == b"IDAT"))
+    kept = [(t, d) for t, d in chunks if t in (b"IHDR", b"PLTE", b"tRNS")]
+    return _png_encode(kept + [(b"IDAT", zlib.compress(idat, 9)), (b"IEND", b"")])
+
+
+def _png_unfilter(data: bytes, width: int, height: int, bpp: int, row_bytes: int) -> list[bytearray]:
+    rows: list[bytearray] = []
+    prev = bytearray(row_bytes)
+    pos = 0
+    for _ in range(height):
+        ftype = data[pos]
+        row = bytearray(data[pos + 1 : pos + 1 + row_bytes])
+        pos += 1 + row_bytes
+        for i in range(row_bytes):
+            a = row[i - bpp] if i >= bpp else 0
+            b = prev[i]
+            c = prev[i - bpp] if i >= bpp else 0
+            if ftype == 1:
+                row[i] = (row[i] + a) & 0xFF
+            elif ftype == 2:
+                row[i] = (row[i] + b) & 0xFF
+            elif ftype == 3:
+                row[i] = (row[i] + ((a + b) >> 1)) & 0xFF
+            elif ftype == 4:
+                pa, pb, pc = abs(b - c), abs(a - c), abs(a + b - 2 * c)
+                pred = a if pa <= pb and pa <= pc else (b if pb <= pc else c)
+                row[i] = (row[i] + pred) & 0xFF
+        rows.append(row)
+        prev = row
+    return rows
+
+
+def _png_decode_rgba(raw: bytes) -> tuple[int, int, list[tuple[int, int, int, int]]] | None:
+    """Decode a non-interlaced PNG to RGBA pixels; None for unsupported formats."""
+    chunks = _png_chunks(raw)
+    width, height, depth, ctype, _, _, interlace = struct.unpack(">IIBBBBB", chunks[0][1])
+    if interlace or (depth != 8 and not (ctype == 3 and depth in (1, 2, 4))):
+        return None
+    channels = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}.get(ctype)
+    if channels is None:
+        return None
+
+    palette: list[tuple[int, int, int, int]] = []
+    plte = next((d for t, d in chunks if t == b"PLTE"), b"")
+    trns = next((d for t, d in chunks if t == b"tRNS"), b"")
+    for i in range(len(plte) // 3):
+        alpha = trns[i] if i < len(trns) else 255
+        palette.append((plte[3 * i], plte[3 * i + 1], plte[3 * i + 2], alpha))
+    # For gray and RGB images tRNS names one fully transparent color, stored
+    # as 16-bit samples (only the low byte matters at depth 8).
+    key: tuple[int, ...] | None = None
+    if ctype in (0, 2) and len(trns) >= 2 * channels:
+        key = struct.unpack(f">{channels}H", trns[: 2 * channels])
+
+    data = zlib.decompress(b"".join(d for t, d in chunks if t == b"IDAT"))
+    row_bytes = (width * channels * depth + 7) // 8
+    rows = _png_unfilter(data, width, height, max(1, channels * depth // 8), row_bytes)
+
+    pixels: list[tuple[int, int, int, int]] = []
+    for row in rows:
+        if ctype == 3:
+            per_byte = 8 // depth
+            mask = (1 << depth) - 1
+            for x in range(width):
+                byte = row[x // per_byte]
+                idx = (byte >> (8 - depth * (x % per_byte + 1))) & mask
+                pixels.append(palette[idx] if idx < len(palette) else (0, 0, 0, 0))
+        elif ctype == 0:
+            pixels.extend((v, v, v, 0 if key == (v,) else 255) for v in row)
+        elif ctype == 4:
+            pixels.extend((row[i], row[i], row[i], row[i + 1]) for i in range(0, len(row), 2))
+        elif ctype == 2:
+            for i in range(0, len(row), 3):
+                r, g, b = row[i], row[i + 1], row[i + 2]
+                pixels.append((r, g, b, 0 if key == (r, g, b) else 255))
+        else:
+            pixels.extend(tuple(row[i : i + 4]) for i in range(0, len(row), 4))  # type: ignore[misc]
+    return width, height, pixels
+
+
+def _resize_box(
+    width: int, height: int, pixels: list[tuple[int, int, int, int]], tw: int, th: int
+) -> list[tuple[int, int, int, int]]:
+    """Downscale to tw x th by averaging source boxes (alpha-weighted)."""
+    out = []
+    for ty in range(th):
+        y0, y1 = ty * height // th, max(ty * height // th + 1, (ty + 1) * height // th)
+        for tx in range(tw):
+            x0, x1 = tx * width // tw, max(tx * width // tw + 1, (tx + 1) * width // tw)
+            r = g = b = a = n = 0
+            for y in range(y0, y1):
+                for x in range(x0, x1):
+                    pr, pg, pb, pa = pixels[y * width + x]
+                    r += pr * pa
+                    g += pg * pa
+                    b += pb * pa
+                    a += pa
+                    n += 1
+            if a:
+                out.append((r // a, g // a, b // a, a // n))
+            else:
+                out.append((0, 0, 0, 0))
+    return out
+
+
+def _median_cut(
+    counts: dict[tuple[int, int, int, int], int], max_colors: int
+) -> dict[tuple[int, int, int, int], tuple[int, int, int, int]]:
+    """Map each color to its representative in a palette of at most `max_colors`."""
+    boxes = [list(counts)]
+    while len(boxes) < max_colors:
+        # Split the box with the widest single-channel range.
+        best, channel, spread = -1, 0, 0
+        for i, box in enumerate(boxes):
+            if len(box) < 2:
+                continue
+            for ch in range(4):
+                values = [c[ch] for c in box]
+                if max(values) - min(values) > spread:
+                    best, channel, spread = i, ch, max(values) - min(values)
+        if best < 0:
+            break
+        box = sorted(boxes.pop(best), key=lambda c: c[channel])
+        total = sum(counts[c] for c in box)
+        acc, cut = 0, 1
+        for j, c in enumerate(box[:-1], start=1):
+            acc += counts[c]
+            cut = j
+            if acc * 2 >= total:
+                break
+        boxes.extend([box[:cut], box[cut:]])
+
+    mapping = {}
+    for box in boxes:
+        weight = sum(counts[c] for c in box)
+        rep = tuple(sum(c[ch] * counts[c] for c in box) // weight for ch in range(4))
+        for c in box:
+            mapping[c] = rep
+    return mapping  # type: ignore[return-value]
+
+
+def _png_encode_palette(width: int, height: int, pixels: list[tuple[int, int, int, int]]) -> bytes:
+    """Encode RGBA pixels as an indexed PNG, quantizing beyond 256 colors."""
+    counts: dict[tuple[int, int, int, int], int] = {}
+    for px in pixels:
+        counts[px] = counts.get(px, 0) + 1
+    if len(counts) > 256:
+        mapping = _median_cut(counts, 256)
+        pixels = [mapping[px] for px in pixels]
+        counts = {}
+        for px in pixels:
+            counts[px] = counts.get(px, 0) + 1
+
+    # Opaque entries last so tRNS can be truncated after the last translucent one.
+    palette = sorted(counts, key=lambda c: (c[3] == 255, -counts[c]))
+    index = {c: i for i, c in enumerate(palette)}
+    depth = next(d for d in (1, 2, 4, 8) if len(palette) <= 1 << d)
+    per_byte = 8 // depth
+
+    raw = bytearray()
+    for y in range(height):
+        raw.append(0)
+        row = pixels[y * width : (y + 1) * width]
+        for x in range(0, width, per_byte):
+            byte = 0
+            for k, px in enumerate(row[x : x + per_byte]):
+                byte |= index[px] << (8 - depth * (k + 1))
+            raw.append(byte)
+
+    translucent = [c[3] for c in palette if c[3] != 255]
+    chunks = [
+        (b"IHDR", struct.pack(">IIBBBBB", width, height, depth, 3, 0, 0, 0)),
+        (b"PLTE", b"".join(bytes(c[:3]) for c in palette)),
+    ]
+    if translucent:
+        chunks.append((b"tRNS", bytes(translucent)))
+    chunks += [(b"IDAT", zlib.compress(bytes(raw), 9)), (b"IEND", b"")]
+    return _png_encode(chunks)
+
+
+def _optimize_png(raw: bytes, size: int) -> bytes:
+    """Shrink a PNG for embedding at `size` px: strip metadata, downscale, quantize.
+
+    The longer side is fitted to `size`; never upscales. Returns whichever of the stripped original and the
+    indexed re-encode is smaller; formats the decoder does not handle are
+    only stripped.
+    """
+    stripped = _png_strip(raw)
+    decoded = _png_decode_rgba(raw)
+    if decoded is None:
+        return stripped
+    width, height, pixels = decoded
+    if width > size or height > size:
+        scale = size / max(width, height)
+        tw, th = max(1, round(width * scale)), max(1, round(height * scale))
+        pixels = _resize_box(width, height, pixels, tw, th)
+        width, height = tw, th
+        stripped = b""
+    indexed = _png_encode_palette(width, height, pixels)
+    return indexed if not stripped or len(indexed) < len(stripped) else stripped
+
+
+class _IconCache:
+    """Optimized icon data URIs, cached on disk by source hash and target size.
+
+    A file written under another `version` of the optimizer is discarded.
+    """
+
+    # Bump when _optimize_png's output changes, so cached icons are redone.
+    version = 2
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, str] = {}
+        self._used: set[str] = set()
+        self._dirty = False
+        if path.exists():
+            try:
+                loaded = json.loads(path.read_text(encoding="utf-8"))
+                if isinstance(loaded, dict) and loaded.get("version") == self.version:
+                    entries = loaded.get("entries")
+                    if isinstance(entries, dict):
+                        self._entries = entries
+                else:
+                    self._dirty = True  # Rewrite in the current format.
+            except Exception:
+                pass
+
+    def data_uri(self, path: Path, size: int) -> str | None:
+        if not path.exists() or not path.is_file():
+            return None
+        raw = path.read_bytes()
+        key = f"{hashlib.sha256(raw).hexdigest()}-{size}"
+        self._used.add(key)
+        uri = self._entries.get(key)
+        if uri is None:
+            try:
+                optimized = _optimize_png(raw, size)
+            except Exception:
+                optimized = raw
+            uri = "data:image/png;base64," + base64.b64encode(optimized).decode("ascii")
+            self._entries[key] = uri
+            self._dirty = True
+        return uri
+
+    def save(self) -> None:
+        # Drop icons no longer referenced by the catalog.
+        if set(self._entries) - self._used:
+            self._entries = {k: v for k, v in self._entries.items() if k in self._used}
+            self._dirty = True
+        if not self._dirty:
+            return
+        _atomic_write_text(
+            self.path,
+            json.dumps({"version": self.version, "entries": self._entries}, indent=2, sort_keys=True),
+        )
+        self._dirty = False
+
+
+def _save_session(prune_http_cache: bool = True) -> None:
+    """Save the HTTP cache and cassette, and report what the session did."""
+    if _SESSION.cache:
+        _SESSION.cache.save(prune=prune_http_cache)
+        print(f"HTTP cache: {_SESSION.cache.hits} hits, {_SESSION.cache.misses} misses")
+    if _SESSION.cassette:
+        cassette = _SESSION.cassette
+        cassette.save()
+        if cassette.replaying:
+            print(f"Cassette: {cassette.replayed} replayed, {cassette.missing} missing ({cassette.path})")
+        else:
+            print(f"Cassette: {cassette.recorded} responses recorded ({cassette.path})")
+    if _SESSION.limiter and (_SESSION.limiter.retries or _SESSION.limiter.waited):
+        print(f"Rate limit: {_SESSION.limiter.retries} retries, {_SESSION.limiter.waited:.1f}s waited")
+
+
+def _finish_trace(profile: Path | None) -> None:
+    """End the last phase, print the timing summary, and export it if asked."""
+    _TRACE.phase(None)
+    print(_TRACE.summary())
+    if profile:
+        _TRACE.export(Path(profile))
+        print(f"Profile: {profile}")
+
+
+def _parse_shard(spec: str) -> tuple[int, int]:
+    """Parse `i/N` (1-based) into (i, N)."""
+    m = re.fullmatch(r"(\d+)/(\d+)", spec.strip())
+    if not m or not 1 <= int(m.group(1)) <= int(m.group(2)):
+        _die(f"Invalid --shard {spec!r}; expected i/N with 1 <= i <= N")
+    return int(m.group(1)), int(m.group(2))
+
+
+def _shard_of(repo: str, count: int) -> int:
+    """Stable 1-based shard for `repo`; independent of list order and Python's hash seed."""
+    return int(hashlib.sha256(repo.encode("utf-8")).hexdigest()[:8], 16) % count + 1
+
+
+def _partial_path(partials_dir: Path, shard: tuple[int, int]) -> Path:
+    return partials_dir / f"shard-{shard[0]}-of-{shard[1]}.json"
+
+
+def _write_partial(
+    path: Path,
+    shard: tuple[int, int],
+    repos: list[str],
+    repo_stats: dict[str, RepoStats],
+    descriptions: dict[str, tuple[str, str]],
+) -> None:
+    """Write a shard's results; `repo_stats` must hold only stats fetched by this run."""
+    fetched = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    payload = {
+        "shard": list(shard),
+        "repos": repos,
+        "stats": {
+            repo: {"stars": s.stars, "pushed_at": s.pushed_at.isoformat(), "fetched": fetched}
+            for repo, s in repo_stats.items()
+        },
+        "descriptions": {repo: {"key": key, "desc": desc} for repo, (key, desc) in descriptions.items()},
+    }
+    _atomic_write_text(path, json.dumps(payload, indent=2, sort_keys=True))
+
+
+def _load_partials(
+    partials_dir: Path,
+) -> tuple[dict[str, tuple[RepoStats, datetime]], dict[str, tuple[str, str]]]:
+    """Combine every shard's partial results; dies unless all N shards are present.
+
+    Stats come back with the time their shard fetched them.
+    """
+    paths = sorted(partials_dir.glob("shard-*-of-*.json"))
+    if not paths:
+        _die(f"No shard results in {partials_dir}")
+
+    stats: dict[str, tuple[RepoStats, datetime]] = {}
+    descriptions: dict[str, tuple[str, str]] = {}
+    seen: dict[int, set[int]] = {}
+    for path in paths:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            index, count = (int(x) for x in data["shard"])
+            for repo, raw in data["stats"].items():
+                stats[repo] = (
+                    RepoStats(stars=int(raw["stars"]), pushed_at=_parse_github_datetime(raw["pushed_at"])),
+                    _parse_github_datetime(raw["fetched"]),
+                )
+            for repo, raw in data["descriptions"].items():
+                descriptions[repo] = (str(raw["key"]), str(raw["desc"]))
+        except (OSError, KeyError, TypeError, ValueError) as exc:
+            _die(f"Invalid shard results {path}: {exc}")
+        seen.setdefault(count, set()).add(index)
+
+    if len(seen) != 1:
+        _die(f"Shard results in {partials_dir} come from different shard counts: {sorted(seen)}")
+    count, indices = next(iter(seen.items()))
+    missing = sorted(set(range(1, count + 1)) - indices)
+    if missing:
+        _die(f"Missing results for shard(s) {missing} of {count} in {partials_dir}")
+    return stats, descriptions
+
+
 def main(argv: list[str]) -> int:
     ap = argparse.ArgumentParser(
         description="Generate SVG assets for README (project dashboard + portal badge)."
     )
+    ap.add_argument(
+        "command",
+        nargs="?",
+        choices=("run", "merge"),
+        default="run",
+        help="run (default) fetches and renders; merge renders from --shard results in --partials.",
+    )
+    ap.add_argument(
+        "--shard",
+        metavar="i/N",
+        help="Fetch stats (and descriptions) for shard i of N of the repos and write a partial "
+        "results file instead of rendering.",
+    )
+    ap.add_argument(
+        "--partials",
+        default=".github/cache/shards",
+        help="Directory for --shard results read by merge (default: .github/cache/shards).",
+    )
     ap.add_argument(
         "--catalog",
         default="data/projects.toml",
         help="Path to data/projects.toml",
     )
+    ap.add_argument(
+        "--no-catalog-cache",
+        action="store_true",
+        help="Parse and validate the catalog from scratch; don't use .github/cache/catalog-compiled.json.",
+    )
     ap.add_argument(
         "--out",
         default=".github/assets/cards",
@@ -999,116 +3173,589 @@ def main(argv: list[str]) -> int:
         default=8,
         help="Number of repos to show in Recent Work (default: 8).",
     )
+    ap.add_argument(
+        "--fetch-concurrency",
+        type=int,
+        default=1,
+        help="Number of parallel repo stats requests (default: 1).",
+    )
+    ap.add_argument(
+        "--fetch-rate",
+        type=float,
+        default=None,
+        help="Cap repo stats requests per second (default: no cap; paced by rate-limit headers).",
+    )
+    ap.add_argument(
+        "--context-concurrency",
+        type=int,
+        default=4,
+        help="Parallel repo context fetches when generating descriptions (default: 4).",
+    )
+    ap.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=2,
+        help="Parallel GitHub Models requests when generating descriptions (default: 2).",
+    )
+    ap.add_argument(
+        "--llm-batch-size",
+        type=int,
+        default=1,
+        help="Repos described per GitHub Models request; >1 asks for JSON output (default: 1).",
+    )
+    ap.add_argument(
+        "--force-render",
+        action="store_true",
+        help="Re-render every SVG even if the build manifest says its inputs are unchanged.",
+    )
+    ap.add_argument(
+        "--columns",
+        type=int,
+        default=2,
+        help="Number of columns in the desktop dashboard layout (default: 2).",
+    )
+    ap.add_argument(
+        "--page-height",
+        type=int,
+        default=0,
+        help="Split the project dashboard into pages of at most this many pixels, "
+        "plus an index card (default: 0, a single dashboard).",
+    )
+    ap.add_argument(
+        "--render-workers",
+        type=int,
+        default=1,
+        help="Render SVG variants/layouts in a pool of N processes (default: 1, in-process).",
+    )
+    ap.add_argument(
+        "--icon-sprite",
+        action="store_true",
+        help=(
+            f"Reference category icons from a shared {ICON_SPRITE_NAME} written next to the "
+            "cards instead of inlining them. Browsers do not follow external <use> refs in "
+            "SVGs shown via <img> (as on GitHub), so this is for the web site only."
+        ),
+    )
+    ap.add_argument(
+        "--icon-scale",
+        type=int,
+        choices=(1, 2),
+        default=2,
+        help=f"Embed icons at 1x or 2x (high-DPI) of their {ICON_SIZE}px drawn size (default: 2).",
+    )
+    ap.add_argument(
+        "--no-icon-optimize",
+        action="store_true",
+        help="Embed icon PNGs as-is instead of stripped, downscaled and palette-quantized.",
+    )
+    ap.add_argument(
+        "--minify",
+        action="store_true",
+        help="Minify SVG output (collapse whitespace, shared CSS classes, rounded coordinates).",
+    )
+    ap.add_argument(
+        "--byte-budget",
+        action="append",
+        default=[],
+        metavar="NAME=BYTES",
+        help="Override the byte budget for assets whose file name starts with NAME (repeatable).",
+    )
+    ap.add_argument(
+        "--budget-fail",
+        action="store_true",
+        help="Exit with an error instead of warning when an asset exceeds its byte budget.",
+    )
+    ap.add_argument(
+        "--http-timeout",
+        type=float,
+        default=30.0,
+        help="Default timeout in seconds for GitHub and model API calls (default: 30).",
+    )
+    ap.add_argument(
+        "--http-retries",
+        type=int,
+        default=3,
+        help="Retries for rate-limited (403/429) responses, with jittered exponential backoff (default: 3).",
+    )
+    ap.add_argument(
+        "--max-rate-wait",
+        type=float,
+        default=60.0,
+        metavar="SECONDS",
+        help="Longest single wait for a rate-limit reset before giving up on a request (default: 60).",
+    )
+    ap.add_argument(
+        "--profile",
+        metavar="OUT.json",
+        help="Write phase and HTTP timing spans as Chrome trace-event JSON (chrome://tracing, Perfetto).",
+    )
+    cassette_group = ap.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Record every HTTP response to DIR/cassette.json for later --replay.",
+    )
+    cassette_group.add_argument(
+        "--replay",
+        metavar="DIR",
+        help=(
+            "Answer all HTTP requests from DIR/cassette.json; nothing goes to the network. "
+            "Implies --no-http-cache and --no-stats-store."
+        ),
+    )
+    ap.add_argument(
+        "--no-http-cache",
+        action="store_true",
+        help="Do not use or update the conditional-request cache in .cache/.",
+    )
+    ap.add_argument(
+        "--stats-ttl",
+        type=float,
+        default=0,
+        metavar="HOURS",
+        help="Reuse repo stats fetched within this many hours instead of refetching (default: 0).",
+    )
+    ap.add_argument(
+        "--stats-max-stale",
+        type=float,
+        default=7,
+        metavar="DAYS",
+        help=(
+            "Serve a repo's snapshot stats after a failed fetch only if they are younger "
+            "than this many days (default: 7)."
+        ),
+    )
+    ap.add_argument(
+        "--no-stats-store",
+        action="store_true",
+        help="Do not use or update the last-known repo stats snapshot in .github/cache/.",
+    )
+    ap.add_argument(
+        "--no-owner-sync",
+        action="store_true",
+        help="Do not list config.github_owner's repos; fetch every repo individually.",
+    )
+    ap.add_argument(
+        "--stats-backend",
+        choices=("rest", "graphql"),
+        default="rest",
+        help="Fetch repo stats one REST call per repo, or batched via GraphQL (default: rest).",
+    )
     args = ap.parse_args(argv)
 
+    _SESSION.timeout = args.http_timeout
+    _SESSION.limiter = _RateLimiter(max_retries=args.http_retries, max_wait=args.max_rate_wait)
+
     repo_root = Path(__file__).resolve().parents[1]
+    if args.record or args.replay:
+        cassette_dir = (repo_root / (args.record or args.replay)).resolve()
+        _SESSION.cassette = _Cassette(cassette_dir, replay=bool(args.replay))
+    profile_path = (repo_root / args.profile).resolve() if args.profile else None
     catalog_path = (repo_root / args.catalog).resolve()
     out_dir = (repo_root / args.out).resolve()
 
-    categories = _load_catalog(catalog_path)
+    _TRACE.phase("catalog")
+    # The cache holds one catalog: the repo's own. Catalogs from outside the
+    # repo are compiled fresh rather than overwrite it.
+    compiled = _CompiledCatalog(
+        None
+        if args.no_catalog_cache or not catalog_path.is_relative_to(repo_root)
+        else repo_root / ".github" / "cache" / "catalog-compiled.json"
+    )
+    categories, catalog_config = compiled.load(catalog_path)
+    compiled.save()
+    _TRACE.count("catalog.categories_reused", compiled.reused)
+    _TRACE.count("catalog.categories_validated", compiled.compiled)
+    _TRACE.phase("icons")
     icon_dir = repo_root / ".github" / "assets" / "icons"
+    icon_cache = None
+    if not args.no_icon_optimize:
+        icon_cache = _IconCache(repo_root / ".github" / "cache" / "icon-cache.json")
     icon_data: dict[str, str] = {}
     for c in categories:
         if not c.icon:
             continue
         if c.icon in icon_data:
             continue
-        data_uri = _load_png_data_uri(icon_dir / c.icon)
+        if icon_cache:
+            data_uri = icon_cache.data_uri(icon_dir / c.icon, ICON_SIZE * args.icon_scale)
+        else:
+            data_uri = _load_png_data_uri(icon_dir / c.icon)
         if data_uri:
             icon_data[c.icon] = data_uri
+    if icon_cache:
+        icon_cache.save()
 
     token = (
         os.environ.get("GITHUB_TOKEN")
         or os.environ.get("GH_TOKEN")
         or os.environ.get("GITHUB_API_TOKEN")
     )
-
-    repos: list[str] = []
+    if args.replay and not token:
+        # Tokens aren't part of cassette keys; a stand-in takes the same code paths as the recording.
+        token = "replay"
+
+    # Catalog repos, then the owner's repos linked from README.md; dict keys dedupe in order.
+    _TRACE.phase("discover repos")
+    owner = _github_owner(catalog_config)
+    tracked: dict[str, None] = {}
     for c in categories:
         for p in c.projects:
             if p.repo and not p.private:
-                repos.append(p.repo)
+                tracked[p.repo] = None
 
-    # Also scan README.md for johnzfitch repos to track
-    import re
     readme_path = repo_root / "README.md"
-    if readme_path.exists():
-        readme_content = readme_path.read_text(encoding="utf-8")
-        readme_repos = re.findall(r'https://github\.com/(johnzfitch/[a-zA-Z0-9_-]+)', readme_content)
-        for r in readme_repos:
-            if r not in repos:
-                repos.append(r)
+    readme = _ReadmeDoc(readme_path)
+    link_re = rf"https://github\.com/({re.escape(owner or 'johnzfitch')}/[a-zA-Z0-9_-]+)"
+    tracked.update(dict.fromkeys(re.findall(link_re, readme.original)))
+    repos = list(tracked)
+    cache_path = repo_root / ".github" / "cache" / "readme-desc-cache.json"
 
+    shard = _parse_shard(args.shard) if args.shard else None
+    if shard and args.command == "merge":
+        _die("--shard and merge are mutually exclusive")
+    partials_dir = (repo_root / args.partials).resolve()
+    if shard:
+        repos = [r for r in repos if _shard_of(r, shard[1]) == shard[0]]
+        print(f"Shard {shard[0]}/{shard[1]}: {len(repos)} of {len(tracked)} repos")
+
+    # A replay neither reads nor rewrites the live snapshots: the stats TTL
+    # would skip recorded requests, and replayed stats would be stored as if
+    # just fetched.
+    if args.replay:
+        args.no_stats_store = True
+    if not args.no_http_cache and not args.replay:
+        # Full response bodies are too bulky to commit with the other caches;
+        # .cache/ is gitignored and carried between CI runs by actions/cache.
+        _SESSION.cache = _HttpCache(repo_root / ".cache" / "http-cache.json")
+
+    _TRACE.phase("merge shards" if args.command == "merge" else "fetch stats")
     repo_stats: dict[str, RepoStats] = {}
-    if not args.no_fetch:
-        for i, repo in enumerate(repos):
-            stats = _fetch_repo_stats(repo, token)
-            if stats:
-                repo_stats[repo] = stats
-
-            # Be polite to unauthenticated rate limits.
-            if not token:
-                time.sleep(0.4)
-            elif i and i % 10 == 0:
-                time.sleep(0.1)
+    fetched_stats: dict[str, RepoStats] = {}  # Only what this run actually fetched.
+    # Snapshot values within the TTL always count; past that, failed fetches
+    # fall back to them for at most --stats-max-stale days.
+    max_age = max(timedelta(days=args.stats_max_stale), timedelta(hours=args.stats_ttl))
+    shard_descriptions: dict[str, tuple[str, str]] = {}
+    if args.command == "merge":
+        shard_stats, shard_descriptions = _load_partials(partials_dir)
+        repo_stats = {r: shard_stats[r][0] for r in repos if r in shard_stats}
+        if not args.no_stats_store:
+            store = _StatsStore(repo_root / ".github" / "cache" / "repo-stats.json")
+            for repo, (stats, fetched) in shard_stats.items():
+                store.put(repo, stats, fetched)
+            store.save()
+            repo_stats = {r: s for r in repos if (s := repo_stats.get(r) or store.get(r, max_age))}
+        print(f"Merge: stats for {len(repo_stats)} repos, {len(shard_descriptions)} descriptions")
+    elif not args.no_fetch:
+        store = None
+        if not args.no_stats_store:
+            store = _StatsStore(repo_root / ".github" / "cache" / "repo-stats.json")
+
+        # One listing page covers up to 100 owned repos, stars included, so
+        # only repos outside the owner's account need per-repo calls.
+        # Shards skip it: the listing is owner-wide and would repeat per shard.
+        synced: dict[str, RepoStats] = {}
+        if owner and not args.no_owner_sync and not shard:
+            listed = _fetch_owner_repo_stats(owner, token)
+            if listed is None:
+                print(f"Warning: could not list repos for {owner}; fetching each repo")
+            else:
+                synced = {r: s for r, s in listed.items() if r in tracked}
+                print(f"Owner sync: {len(listed)} repos listed, {len(synced)} tracked")
+
+        due = [r for r in repos if r not in synced]
+        if store:
+            ttl = timedelta(hours=args.stats_ttl)
+            due = [r for r in due if not store.is_fresh(r, ttl)]
+
+        # --fetch-rate caps our own request rate; _RateLimiter slows down further
+        # when the rate-limit headers say the budget is running low.
+        repo_stats = _fetch_all_repo_stats(
+            due,
+            token,
+            concurrency=args.fetch_concurrency,
+            rate=args.fetch_rate,
+            backend=args.stats_backend,
+        )
+        repo_stats.update(synced)
+        fetched_stats = dict(repo_stats)
+
+        if store:
+            for repo, stats in repo_stats.items():
+                store.put(repo, stats)
+            if not shard:
+                store.save()  # Shards report through their partial; merge saves.
+            failed = [r for r in due if r not in repo_stats]
+            repo_stats = {r: s for r in repos if (s := repo_stats.get(r) or store.get(r, max_age))}
+            stale = sum(1 for r in failed if r in repo_stats)
+            _TRACE.count("stats.fresh_in_snapshot", len(repos) - len(due) - len(synced))
+            _TRACE.count("stats.served_stale", stale)
+            _TRACE.count("stats.failed", len(failed) - stale)
+            print(
+                f"Stats: {len(due) - len(failed)} fetched, {len(synced)} from owner sync, "
+                f"{len(repos) - len(due) - len(synced)} fresh in snapshot, "
+                f"{stale} served stale after a failed fetch"
+            )
+        else:
+            repo_stats = {r: repo_stats[r] for r in repos if r in repo_stats}
+
+    if shard:
+        _TRACE.phase("describe shard repos")
+        descriptions: dict[str, tuple[str, str]] = {}
+        if args.update_descriptions and token and readme.exists:
+            print("Describing shard repos...")
+            descriptions = _generate_readme_descriptions(
+                readme,
+                repos,
+                token,
+                _DescCache(cache_path),
+                context_workers=args.context_concurrency,
+                llm_workers=args.llm_concurrency,
+                llm_batch_size=args.llm_batch_size,
+            )
+        partial = _partial_path(partials_dir, shard)
+        # Snapshot values (fresh under the TTL or served stale) stay out of
+        # the partial; merge would otherwise re-stamp them as just fetched.
+        _write_partial(partial, shard, repos, fetched_stats, descriptions)
+        print(f"Shard results: {partial} ({len(fetched_stats)} stats, {len(descriptions)} descriptions)")
+        # A shard only asks for its own repos; keep the other shards' entries.
+        _save_session(prune_http_cache=False)
+        _finish_trace(profile_path)
+        return 0
 
     total_stars = sum(s.stars for s in repo_stats.values())
     last_push_dt = max((s.pushed_at for s in repo_stats.values()), default=None)
     last_push = last_push_dt.strftime("%Y-%m-%d") if last_push_dt else "unknown"
 
-    outputs: dict[str, str] = {}
+    _TRACE.phase("render")
+    icon_sprite = ICON_SPRITE_NAME if args.icon_sprite else None
+
+    # Each output is (inputs fingerprint, render function, kwargs); unchanged inputs skip the render.
+    script_hash = _fingerprint(hashlib.sha256(Path(__file__).read_bytes()).hexdigest(), args.minify)
+    catalog_repos = {p.repo for c in categories for p in c.projects if p.repo}
+    dashboard_inputs = (
+        [asdict(c) for c in categories],
+        {r: asdict(s) for r, s in repo_stats.items() if r in catalog_repos},
+        {name: hashlib.sha256(uri.encode("ascii")).hexdigest() for name, uri in icon_data.items()},
+        total_stars,
+        last_push,
+        icon_sprite,
+        args.columns,
+    )
+
+    # Text shared by every dashboard variant/layout is computed once. Paged
+    # dashboards instead build a model per page, and only for stale pages.
+    model = None if args.page_height else _prepare_dashboard(categories, repo_stats, columns=args.columns)
+    pages = {
+        layout: _paginate_categories(categories, args.columns if layout == "desktop" else 1, args.page_height)
+        for layout in ("desktop", "mobile")
+        if args.page_height
+    }
+
+    outputs: dict[str, tuple[str, Callable[..., str], dict[str, Any]]] = {}
     for variant in ("light", "dark"):
-        outputs[f"typing-philosophy-{variant}.svg"] = _render_typing_philosophy_svg(
-            variant=variant
+        outputs[f"typing-philosophy-{variant}.svg"] = (
+            _fingerprint(script_hash, variant),
+            _render_typing_philosophy_svg,
+            {"variant": variant},
         )
-        outputs[f"portal-badge-{variant}.svg"] = _render_portal_badge_svg(
-            variant=variant,
-            total_stars=total_stars,
-            last_push=last_push,
+        outputs[f"portal-badge-{variant}.svg"] = (
+            _fingerprint(script_hash, variant, total_stars, last_push),
+            _render_portal_badge_svg,
+            {"variant": variant, "total_stars": total_stars, "last_push": last_push},
         )
         for layout in ("desktop", "mobile"):
-            outputs[f"projects-{layout}-{variant}.svg"] = _render_project_dashboard_svg(
-                categories=categories,
-                repo_stats=repo_stats,
-                icon_data=icon_data,
-                variant=variant,
-                layout=layout,
+            if args.page_height:
+                n_pages = len(pages[layout])
+                outputs[f"projects-{layout}-{variant}-index.svg"] = (
+                    _fingerprint(
+                        script_hash,
+                        variant,
+                        layout,
+                        [[(c.id, c.title, len(c.projects)) for c in page] for page in pages[layout]],
+                        total_stars,
+                        last_push,
+                    ),
+                    _render_dashboard_index_svg,
+                    {
+                        "pages": pages[layout],
+                        "variant": variant,
+                        "layout": layout,
+                        "total_stars": total_stars,
+                        "last_push": last_push,
+                    },
+                )
+                for number, page in enumerate(pages[layout], start=1):
+                    page_repos = {p.repo for c in page for p in c.projects if p.repo}
+                    page_inputs = (
+                        [asdict(c) for c in page],
+                        {r: asdict(s) for r, s in repo_stats.items() if r in page_repos},
+                        {c.icon: dashboard_inputs[2].get(c.icon) for c in page},
+                        total_stars,
+                        last_push,
+                        icon_sprite,
+                        args.columns,
+                    )
+                    outputs[f"projects-{layout}-{variant}-{number}.svg"] = (
+                        _fingerprint(script_hash, variant, layout, page_inputs, number, n_pages),
+                        _render_project_dashboard_svg,
+                        {
+                            "categories": page,
+                            "repo_stats": repo_stats,
+                            "icon_data": icon_data,
+                            "variant": variant,
+                            "layout": layout,
+                            "icon_sprite": icon_sprite,
+                            "columns": args.columns,
+                            "page": (number, n_pages),
+                        },
+                    )
+                continue
+            outputs[f"projects-{layout}-{variant}.svg"] = (
+                _fingerprint(script_hash, variant, layout, dashboard_inputs),
+                _render_project_dashboard_svg,
+                {
+                    "categories": categories,
+                    "repo_stats": repo_stats,
+                    "icon_data": icon_data,
+                    "variant": variant,
+                    "layout": layout,
+                    "model": model,
+                    "icon_sprite": icon_sprite,
+                },
             )
+    if icon_sprite:
+        outputs[icon_sprite] = (
+            _fingerprint(script_hash, dashboard_inputs[2]),
+            _render_icon_sprite_svg,
+            {"icon_data": icon_data},
+        )
 
-    changed = False
-    for name, content in outputs.items():
-        changed |= _write_if_changed(out_dir / name, content)
+    manifest = _BuildManifest(repo_root / ".github" / "cache" / "render-manifest.json")
+    # Only outputs inside the repo are tracked, so preview renders elsewhere
+    # don't leak into the committed manifest.
+    force = args.force_render or not out_dir.is_relative_to(repo_root)
+    stale = {
+        name: job
+        for name, job in outputs.items()
+        if force or not manifest.is_fresh(
+            (out_dir / name).relative_to(repo_root).as_posix(), job[0], out_dir / name
+        )
+    }
+    skipped = len(outputs) - len(stale)
+    _TRACE.count("render.skipped", skipped)
 
-    # Update README.md star counts for repos with 10+ stars
-    readme_path = repo_root / "README.md"
-    cache_path = repo_root / ".github" / "cache" / "readme-desc-cache.json"
+    if args.render_workers > 1 and len(stale) > 1:
+        with ProcessPoolExecutor(max_workers=args.render_workers) as pool:
+            futures = {name: pool.submit(fn, **kwargs) for name, (_, fn, kwargs) in stale.items()}
+            rendered = {name: fut.result() for name, fut in futures.items()}
+    else:
+        rendered = {name: fn(**kwargs) for name, (_, fn, kwargs) in stale.items()}
+    if args.minify:
+        rendered = {name: _minify_svg(content) for name, content in rendered.items()}
+
+    budgets = dict(SVG_BYTE_BUDGETS)
+    for spec in args.byte_budget:
+        prefix, _, size = spec.partition("=")
+        if not prefix or not size.isdigit():
+            _die(f"Invalid --byte-budget {spec!r}; expected NAME=BYTES")
+        budgets[prefix] = int(size)
+    sizes = {name: len(content.encode("utf-8")) for name, content in rendered.items()}
+    sizes.update(
+        {name: (out_dir / name).stat().st_size for name in outputs if name not in rendered}
+    )
+    problems = _over_budget(sizes, budgets)
+    for problem in problems:
+        print(f"Warning: {problem}")
+    if problems and args.budget_fail:
+        _die(f"{len(problems)} asset(s) over byte budget")
+
+    _TRACE.phase("write assets")
+    changed = False
+    for name, content in rendered.items():
+        out_path = out_dir / name
+        if force:
+            changed |= _write_if_changed(out_path, content)
+        else:
+            key = out_path.relative_to(repo_root).as_posix()
+            changed |= manifest.write(key, stale[name][0], out_path, content)
+    # Drop dashboard files this run no longer produces: surplus pages, the
+    # index and pages after going back to one file, or the single file
+    # after switching to pages. Files README.md still embeds are kept.
+    dashboard_re = re.compile(r"projects-(?:desktop|mobile)-(?:light|dark)(?:-\d+|-index)?\.svg")
+    for old in sorted(out_dir.glob("projects-*.svg")):
+        if dashboard_re.fullmatch(old.name) and old.name not in outputs:
+            if old.name in readme.original:
+                print(f"Warning: {old.name} is no longer generated but README.md still uses it")
+                continue
+            old.unlink()
+            if old.is_relative_to(repo_root):
+                manifest.forget(old.relative_to(repo_root).as_posix())
+            changed = True
+    manifest.save()
+    if skipped:
+        print(f"Render: {skipped}/{len(outputs)} outputs unchanged, skipped")
+
+    # All README passes edit `readme` in memory; it is written once below.
 
     # Rotate Recent Work section (if enabled)
+    _TRACE.phase("rotate recent work")
     if args.rotate_recent:
         if repo_stats:
             print("Rotating Recent Work section...")
             rotated = _rotate_recent_work(
-                readme_path, repo_stats, token, cache_path, count=args.recent_count
+                readme,
+                repo_stats,
+                token,
+                cache_path,
+                count=args.recent_count,
+                context_workers=args.context_concurrency,
+                llm_workers=args.llm_concurrency,
+                llm_batch_size=args.llm_batch_size,
             )
             if rotated:
                 print(f"README: {readme_path} (Recent Work rotated)")
         else:
             print("Warning: --rotate-recent requires repo stats (don't use --no-fetch)")
 
-    readme_changed = _update_readme_stars(readme_path, repo_stats, min_stars=10)
+    # Update README.md star counts for repos with 10+ stars
+    _TRACE.phase("readme stars")
+    readme_changed = _update_readme_stars(readme, repo_stats, min_stars=10)
     if readme_changed:
         print(f"README: {readme_path} (stars updated)")
 
-    # Update Recent Work descriptions via LLM (if enabled)
-    if args.update_descriptions and token:
+    # Update Recent Work descriptions via LLM (if enabled); merge applies the shards' instead.
+    _TRACE.phase("readme descriptions")
+    if args.command == "merge":
+        if shard_descriptions:
+            cache = _DescCache(cache_path)
+            if _apply_readme_descriptions(readme, cache, shard_descriptions):
+                print(f"README: {readme_path} (descriptions updated)")
+            cache.save()
+    elif args.update_descriptions and token:
         print("Updating Recent Work descriptions...")
-        desc_changed = _update_readme_descriptions(readme_path, repos, token, cache_path)
+        desc_changed = _update_readme_descriptions(
+            readme,
+            repos,
+            token,
+            cache_path,
+            context_workers=args.context_concurrency,
+            llm_workers=args.llm_concurrency,
+            llm_batch_size=args.llm_batch_size,
+        )
         if desc_changed:
             print(f"README: {readme_path} (descriptions updated)")
     elif args.update_descriptions and not token:
         print("Warning: --update-descriptions requires GITHUB_TOKEN")
 
+    _TRACE.phase("save")
+    if readme.save():
+        print(f"README: {readme_path} (written)")
+
+    _save_session()
+
     print(f"Assets: {out_dir} ({'changed' if changed else 'no changes'})")
+    _finish_trace(profile_path)
     return 0
 
 